@@ -0,0 +1,241 @@
+"""Build step for the game assets
+
+    python build_assets.py [--force]
+
+Writes generated files to assets/build/ (ignored by git). The game uses
+them when they exist and falls back to the loose files in assets/
+otherwise:
+
+- atlas.png + atlas.json: all sprites (symbols and pokéballs) packed into
+  one image, with the rect of every sprite keyed by its path below
+  assets/sprites/
+- sprites/<name>@<w>x<h>.bgra: symbol sprites pre-scaled to every size the
+  reels use, as raw pixels in the layout of a convert_alpha() surface, so
+  loading is a file read instead of PNG decoding plus scaling
+- sounds/*.ogg, music/*.ogg: large WAVs transcoded with ffmpeg (skipped
+  if ffmpeg is not installed)
+- manifest.json: per source the content hash it was built from and its
+  outputs. Unchanged sources are skipped, so after changing one sprite
+  only that sprite is rebuilt.
+- assets.bundle: everything above plus the loose files in assets/ in one
+  memory-mapped file (utils/asset_bundle.py). The frozen game ships only
+  this file; in development set POKESLOT_BUNDLE=1 to load from it.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import pygame
+
+from utils.asset_bundle import write_bundle
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ASSETS = os.path.join(ROOT, 'assets')
+SPRITES = os.path.join(ASSETS, 'sprites')
+BUILD = os.path.join(ASSETS, 'build')
+MANIFEST = os.path.join(BUILD, 'manifest.json')
+BUNDLE = os.path.join(BUILD, 'assets.bundle')
+
+# Erhöhen, wenn sich ein Build-Schritt ändert, damit alles neu gebaut wird
+BUILD_VERSION = 1
+
+ATLAS_WIDTH = 512
+ATLAS_PADDING = 2  # Abstand zwischen den Sprites im Atlas
+
+# WAVs ab dieser Größe (und alle Musikstücke) werden nach OGG umgewandelt
+TRANSCODE_MIN_BYTES = 64 * 1024
+OGG_QUALITY = 5
+
+
+def rel(path):
+    """Path relative to assets/, with '/' separators (manifest keys)"""
+    return os.path.relpath(path, ASSETS).replace(os.sep, '/')
+
+
+def files(folder, extension):
+    """All files below assets/<folder> with the given extension, sorted"""
+    found = []
+    for current, _dirs, names in os.walk(os.path.join(ASSETS, folder)):
+        for name in names:
+            if name.lower().endswith(extension):
+                found.append(os.path.join(current, name))
+    return sorted(found)
+
+
+def content_hash(paths, *params):
+    """sha256 over the source files and the step parameters"""
+    digest = hashlib.sha256(f"{BUILD_VERSION}:{params}".encode('utf-8'))
+    for path in paths:
+        digest.update(rel(path).encode('utf-8'))
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class Manifest:
+    """manifest.json: {key: {"hash": ..., "outputs": {variant: path below assets/build}}}"""
+
+    def __init__(self, force=False):
+        self.entries = {}
+        if not force and os.path.exists(MANIFEST):
+            with open(MANIFEST, encoding='utf-8') as f:
+                self.entries = json.load(f).get('assets', {})
+        self.built = 0
+        self.skipped = 0
+
+    def up_to_date(self, key, digest):
+        entry = self.entries.get(key)
+        return (entry is not None and entry['hash'] == digest and
+                all(os.path.exists(os.path.join(BUILD, out)) for out in entry['outputs'].values()))
+
+    def step(self, key, digest, build):
+        """Run build() -> {variant: output} unless `key` is already built from `digest`"""
+        if self.up_to_date(key, digest):
+            self.skipped += 1
+            return
+        outputs = build()
+        if outputs:
+            self.entries[key] = {'hash': digest, 'outputs': outputs}
+            self.built += 1
+
+    def save(self):
+        with open(MANIFEST, 'w', encoding='utf-8') as f:
+            json.dump({'version': BUILD_VERSION, 'assets': self.entries}, f, indent=2, sort_keys=True)
+
+
+def pack(sizes, width=ATLAS_WIDTH, padding=ATLAS_PADDING):
+    """Shelf packing: returns {name: (x, y, w, h)} and the atlas height"""
+    rects = {}
+    x = y = shelf_height = 0
+    # Höchste zuerst, damit die Regale gut gefüllt sind
+    for name, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], item[0])):
+        if w > width:
+            raise ValueError(f"Sprite {name} is wider than the atlas ({w} > {width})")
+        if x + w > width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        rects[name] = (x, y, w, h)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+    return rects, y + shelf_height
+
+
+def build_atlas(manifest):
+    """Pack all sprites into atlas.png and write their rects to atlas.json"""
+    paths = files('sprites', '.png')
+
+    def build():
+        images = {os.path.relpath(p, SPRITES).replace(os.sep, '/'): pygame.image.load(p) for p in paths}
+        rects, height = pack({name: image.get_size() for name, image in images.items()})
+        atlas = pygame.Surface((ATLAS_WIDTH, height), pygame.SRCALPHA)
+        for name, (x, y, _w, _h) in rects.items():
+            # MAX auf die leere Fläche kopiert die Pixel unverändert
+            atlas.blit(images[name], (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        pygame.image.save(atlas, os.path.join(BUILD, 'atlas.png'))
+        with open(os.path.join(BUILD, 'atlas.json'), 'w', encoding='utf-8') as f:
+            json.dump({'image': 'atlas.png', 'sprites': {name: list(rect) for name, rect in rects.items()}},
+                      f, indent=2)
+        print(f"Atlas: {len(rects)} Sprites, {ATLAS_WIDTH}x{height}")
+        return {'png': 'atlas.png', 'index': 'atlas.json'}
+
+    manifest.step('atlas', content_hash(paths, ATLAS_WIDTH, ATLAS_PADDING), build)
+
+
+def prescale_sprites(manifest):
+    """Symbol sprites at every reel size, as raw BGRA pixels"""
+    from games.slot_machine import SlotMachine
+    base_size = SlotMachine.SPRITE_SIZE
+    sizes = SlotMachine.reel_sprite_sizes()
+    os.makedirs(os.path.join(BUILD, 'sprites'), exist_ok=True)
+
+    for symbol in SlotMachine.SYMBOLS:
+        path = os.path.join(SPRITES, f'{symbol.lower()}.png')
+        if not os.path.exists(path):
+            continue
+
+        def build(path=path):
+            # Gleiche Schritte wie zur Laufzeit: laden, auf SPRITE_SIZE, dann auf die Walzengröße
+            sprite = pygame.transform.scale(pygame.image.load(path), base_size)
+            stem = os.path.splitext(os.path.basename(path))[0]
+            outputs = {}
+            for w, h in sizes:
+                out = f'sprites/{stem}@{w}x{h}.bgra'
+                scaled = pygame.transform.scale(sprite, (w, h))
+                with open(os.path.join(BUILD, out), 'wb') as f:
+                    f.write(pygame.image.tostring(scaled, 'BGRA'))
+                outputs[f'{w}x{h}'] = out
+            print(f"Vorskaliert: {rel(path)} -> {', '.join(outputs)}")
+            return outputs
+
+        manifest.step(rel(path), content_hash([path], base_size, sizes), build)
+
+
+def transcode_audio(manifest):
+    """Large WAVs and all music to OGG Vorbis via ffmpeg"""
+    sources = [p for p in files('sounds', '.wav') if os.path.getsize(p) >= TRANSCODE_MIN_BYTES]
+    sources += files('music', '.wav')
+    if not sources:
+        return
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        print("ffmpeg nicht gefunden, WAVs werden nicht umgewandelt")
+        return
+
+    for path in sources:
+        def build(path=path):
+            out = os.path.splitext(rel(path))[0] + '.ogg'
+            target = os.path.join(BUILD, out)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            result = subprocess.run([ffmpeg, '-y', '-loglevel', 'error', '-i', path,
+                                     '-c:a', 'libvorbis', '-q:a', str(OGG_QUALITY), target])
+            if result.returncode != 0:
+                print(f"Fehler beim Umwandeln von {rel(path)}")
+                return None
+            print(f"OGG: {rel(path)} {os.path.getsize(path) // 1024} KB -> {os.path.getsize(target) // 1024} KB")
+            return {'ogg': out}
+
+        manifest.step(rel(path), content_hash([path], OGG_QUALITY), build)
+
+
+def build_bundle(manifest):
+    """Pack all files below assets/ (without icons) into assets.bundle"""
+    paths = [p for p in files('', '') if p != BUNDLE and not rel(p).startswith('icons/')]
+
+    def build():
+        size = write_bundle(BUNDLE, {rel(p): p for p in paths})
+        print(f"Bundle: {len(paths)} Dateien, {size // 1024} KB")
+        return {'bundle': 'assets.bundle'}
+
+    # Ohne das Manifest selbst, das sich durch diesen Schritt ändert; seine
+    # übrigen Änderungen kommen mit geänderten Build-Ausgaben
+    manifest.step('bundle', content_hash([p for p in paths if p != MANIFEST]), build)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Assets für das Spiel vorbereiten (assets/build/)")
+    parser.add_argument('--force', action='store_true', help="Alles neu bauen, Manifest ignorieren")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    os.makedirs(BUILD, exist_ok=True)
+    manifest = Manifest(force=args.force)
+    build_atlas(manifest)
+    prescale_sprites(manifest)
+    transcode_audio(manifest)
+    manifest.save()
+    # Zuletzt, damit das Bundle alle Build-Ausgaben samt Manifest enthält
+    build_bundle(manifest)
+    manifest.save()
+    print(f"{manifest.built} gebaut, {manifest.skipped} unverändert, "
+          f"{(time.perf_counter() - start) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
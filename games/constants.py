@@ -83,7 +83,6 @@ FONT_FILES = {
 }
 
 # Animation settings
-PARTICLE_MAX = 100
 PARTICLE_LIFETIME = 1.0
 PARTICLE_SIZE = 3
 TRANSITION_SPEED = 10
@@ -25,3 +25,6 @@ EASY_PRIZES = [
     "Art rare karte",
     "Art Rare Karte",
 ]
+
+# Gewichtungen der Symbole (Lugia, Charizard, Tyranitar, Gengar, Oshawott, Arcanine)
+WEIGHTS = [5, 23, 23, 23, 13, 13]
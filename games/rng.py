@@ -0,0 +1,98 @@
+"""Seedable random number service for the games.
+
+All randomness goes through an RNGService with separate streams: the
+`outcome` stream decides spins and prizes, the `cosmetic` stream drives
+animations, particles and shake. Cosmetic draws therefore never shift the
+outcome sequence, and a session started with a recorded seed can be
+replayed exactly (see slot_engine.replay_session).
+
+Each stream refills a buffer of uniforms in bulk, so hot paths take
+values from a list instead of calling into the generator one at a time.
+"""
+import hashlib
+import random
+import secrets
+
+BLOCK_SIZE = 1024
+
+
+def derive_seed(seed, name):
+    """Independent child seed for the stream `name`"""
+    digest = hashlib.sha256(f"{seed}:{name}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+
+class RandomStream:
+    """Buffered stream of uniforms with the helpers the games need
+
+    The values are exactly those of random.Random(seed).random(), the
+    block size only changes how often the buffer is refilled.
+    """
+
+    def __init__(self, seed, block_size=BLOCK_SIZE):
+        self.seed = seed
+        self.block_size = block_size
+        self.draws = 0
+        self._random = random.Random(seed)
+        self._buffer = []
+        self._pos = 0
+
+    def _refill(self):
+        r = self._random.random
+        self._buffer = [r() for _ in range(self.block_size)]
+        self._pos = 0
+
+    def random(self):
+        """Uniform float in [0, 1)"""
+        if self._pos >= len(self._buffer):
+            self._refill()
+        value = self._buffer[self._pos]
+        self._pos += 1
+        self.draws += 1
+        return value
+
+    def block(self, k):
+        """Next k uniforms as a list"""
+        values = []
+        while k > 0:
+            if self._pos >= len(self._buffer):
+                self._refill()
+            take = min(k, len(self._buffer) - self._pos)
+            values.extend(self._buffer[self._pos:self._pos + take])
+            self._pos += take
+            k -= take
+        self.draws += len(values)
+        return values
+
+    def randrange(self, n):
+        """Integer in [0, n)"""
+        return int(self.random() * n)
+
+    def randint(self, a, b):
+        """Integer in [a, b], both included"""
+        return a + int(self.random() * (b - a + 1))
+
+    def uniform(self, a, b):
+        return a + (b - a) * self.random()
+
+    def shuffle(self, seq):
+        """Shuffle a list in place (Fisher-Yates)"""
+        for i in range(len(seq) - 1, 0, -1):
+            j = int(self.random() * (i + 1))
+            seq[i], seq[j] = seq[j], seq[i]
+
+    def choice(self, seq):
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[int(self.random() * len(seq))]
+
+
+class RNGService:
+    """Outcome and cosmetic random streams derived from one seed"""
+
+    def __init__(self, seed=None, block_size=BLOCK_SIZE):
+        if seed is None:
+            seed = secrets.randbits(63)
+        self.seed = seed
+        self.outcome = RandomStream(derive_seed(seed, 'outcome'), block_size)
+        self.cosmetic = RandomStream(derive_seed(seed, 'cosmetic'), block_size)
@@ -0,0 +1,263 @@
+"""Vectorized Monte Carlo simulation of the slot machine odds.
+
+Draws whole batches of spins as an (N, REELS) integer array and
+classifies them with NumPy array operations, using the same symbols,
+weights and outcome rules as games/slot_engine.py. Meant for checking the
+advertised odds, e.g.:
+
+    python main.py simulate --spins 1e9 --workers 8
+
+NumPy is only needed for this module; the game itself runs without it.
+"""
+import os
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from games.slot_engine import (
+    WEIGHTS, SYMBOLS, REELS, OUTCOMES, JACKPOT, MAIN, DOUBLE, EASY, JACKPOT_SYMBOL, NO_PRIZE,
+    outcome_table, sampler, current_prizes, pick_prize
+)
+
+# Spins per batch - keeps memory around 100 MB independent of the total
+CHUNK_SIZE = 5_000_000
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("The simulator needs NumPy: pip install numpy")
+
+
+def draw_spins(n, weights=WEIGHTS, reels=REELS, rng=None):
+    """Draw n spins at once as an (n, reels) array of symbol indices"""
+    _require_numpy()
+    rng = rng if rng is not None else np.random.default_rng()
+    total = sum(weights)
+    if all(float(w).is_integer() for w in weights) and total <= 65536:
+        # Ganzzahlige Gewichte: eine Zahl in [0, total) plus Lookup-Tabelle
+        lut = np.repeat(np.arange(len(weights), dtype=np.uint8), [int(w) for w in weights])
+        dtype = np.uint8 if total <= 256 else np.uint16
+        return lut[rng.integers(0, int(total), (n, reels), dtype=dtype)]
+
+    # Sonst die Alias-Tabelle der Engine, vektorisiert
+    alias_sampler = sampler(weights)
+    prob = np.asarray(alias_sampler.prob)
+    alias = np.asarray(alias_sampler.alias, dtype=np.uint8)
+    u = rng.random((n, reels)) * len(prob)
+    column = u.astype(np.uint8)
+    return np.where(u - column < prob[column], column, alias[column])
+
+
+def classify_spins(spins, num_symbols=None):
+    """Classify an (n, reels) array, returns outcome indices into OUTCOMES
+
+    0 = jackpot, 1 = main (triple), 2 = double, 3 = easy. Each row is
+    encoded like OutcomeTable.encode() and looked up in the outcome table,
+    so the rules are exactly those of slot_engine.classify().
+    """
+    _require_numpy()
+    num_symbols = num_symbols or len(WEIGHTS)
+    reels = spins.shape[1]
+    lookup = np.asarray(outcome_table([1] * num_symbols, reels).outcome_index, dtype=np.uint8)
+
+    code = np.zeros(len(spins), dtype=np.int64)
+    for i in range(reels):
+        code *= num_symbols
+        code += spins[:, i]
+    return lookup[code]
+
+
+def _prize_histogram(counts, triple_counts, double_hits, prizes, rng):
+    """Distribute the hits of one batch over the configured prizes"""
+    histogram = {}
+
+    def add(prize, n):
+        if n:
+            histogram[prize] = histogram.get(prize, 0) + int(n)
+
+    add(pick_prize(JACKPOT, JACKPOT_SYMBOL, prizes), counts[0])
+    for symbol in range(1, len(triple_counts)):
+        add(pick_prize(MAIN, symbol, prizes), triple_counts[symbol])
+
+    # Doppelte und Trostpreise werden gleichverteilt aus der Liste gezogen
+    for outcome, n in ((DOUBLE, double_hits), (EASY, counts[3])):
+        pool = prizes[outcome]
+        if not pool:
+            add(NO_PRIZE, n)
+            continue
+        for prize, k in zip(pool, rng.multinomial(int(n), [1 / len(pool)] * len(pool))):
+            add(prize, k)
+    return histogram
+
+
+def _run(spins, weights, reels, seed, chunk_size, prizes):
+    """Raw histograms for `spins` spins, the work of one process"""
+    rng = np.random.default_rng(seed)
+    counts = np.zeros(len(OUTCOMES), dtype=np.int64)
+    triple_counts = np.zeros(len(weights), dtype=np.int64)
+    symbol_counts = np.zeros(len(weights), dtype=np.int64)
+    prize_counts = {}
+
+    remaining = spins
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        batch = draw_spins(n, weights, reels, rng)
+        outcome = classify_spins(batch, len(weights))
+        batch_counts = np.bincount(outcome, minlength=len(OUTCOMES))
+        batch_triples = np.bincount(batch[outcome <= 1, 0], minlength=len(weights))
+        counts += batch_counts
+        triple_counts += batch_triples
+        symbol_counts += np.bincount(batch.ravel(), minlength=len(weights))
+        for prize, k in _prize_histogram(batch_counts, batch_triples, batch_counts[2], prizes, rng).items():
+            prize_counts[prize] = prize_counts.get(prize, 0) + k
+        remaining -= n
+
+    return {
+        'spins': spins,
+        'counts': counts,
+        'triple_counts': triple_counts,
+        'symbol_counts': symbol_counts,
+        'prize_counts': prize_counts
+    }
+
+
+def _summarize(raw, reels):
+    """Turn merged raw histograms into the simulate() result dict"""
+    spins = raw['spins']
+    counts = raw['counts']
+    triple_counts = raw['triple_counts']
+    jackpots = int(counts[0])
+    return {
+        'spins': spins,
+        'counts': dict(zip(OUTCOMES, counts.tolist())),
+        'rates': dict(zip(OUTCOMES, (counts / max(spins, 1)).tolist())),
+        'triple_counts': triple_counts.tolist(),
+        'triple_rates': (triple_counts / max(spins, 1)).tolist(),
+        'symbol_counts': raw['symbol_counts'].tolist(),
+        'symbol_rates': (raw['symbol_counts'] / max(spins * reels, 1)).tolist(),
+        'prize_counts': dict(sorted(raw['prize_counts'].items(), key=lambda item: -item[1])),
+        'spins_per_jackpot': spins / jackpots if jackpots else float('inf')
+    }
+
+
+def simulate(spins, weights=WEIGHTS, reels=REELS, seed=None, chunk_size=CHUNK_SIZE, prizes=None):
+    """Run `spins` simulated spins and return hit statistics
+
+    The result dict contains the raw `counts` per outcome class, their
+    `rates`, `triple_counts`/`triple_rates` per symbol (Lugia's triple is
+    the jackpot), `symbol_counts`/`symbol_rates` over all reels,
+    `prize_counts` per prize and `spins_per_jackpot`.
+    """
+    _require_numpy()
+    prizes = prizes if prizes is not None else current_prizes()
+    raw = _run(int(spins), tuple(weights), reels, seed, chunk_size, prizes)
+    return _summarize(raw, reels)
+
+
+def _worker(args):
+    spins, weights, reels, seed, chunk_size, prizes = args
+    start = time.perf_counter()
+    raw = _run(spins, weights, reels, seed, chunk_size, prizes)
+    raw['elapsed'] = time.perf_counter() - start
+    return raw
+
+
+def simulate_parallel(spins, workers=None, weights=WEIGHTS, reels=REELS, seed=None,
+                      chunk_size=CHUNK_SIZE, prizes=None):
+    """simulate() split across a process pool
+
+    Every worker gets an independent stream spawned from one
+    numpy SeedSequence, so a run is reproducible for a given seed and
+    worker count. Besides the simulate() keys the result holds `seed`,
+    `workers`, `elapsed` (wall clock) and `worker_rates` (spins/s per
+    worker process).
+    """
+    _require_numpy()
+    from concurrent.futures import ProcessPoolExecutor
+
+    spins = int(spins)
+    workers = max(1, workers or os.cpu_count() or 1)
+    prizes = prizes if prizes is not None else current_prizes()
+    seed_sequence = np.random.SeedSequence(seed)
+    shares = [spins // workers + (1 if i < spins % workers else 0) for i in range(workers)]
+    jobs = [(share, tuple(weights), reels, child, chunk_size, prizes)
+            for share, child in zip(shares, seed_sequence.spawn(workers))]
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [_worker(jobs[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_worker, jobs))
+    elapsed = time.perf_counter() - start
+
+    merged = {
+        'spins': spins,
+        'counts': sum(r['counts'] for r in results),
+        'triple_counts': sum(r['triple_counts'] for r in results),
+        'symbol_counts': sum(r['symbol_counts'] for r in results),
+        'prize_counts': {}
+    }
+    for r in results:
+        for prize, k in r['prize_counts'].items():
+            merged['prize_counts'][prize] = merged['prize_counts'].get(prize, 0) + k
+
+    result = _summarize(merged, reels)
+    result['seed'] = seed_sequence.entropy
+    result['workers'] = workers
+    result['elapsed'] = elapsed
+    result['worker_rates'] = [r['spins'] / r['elapsed'] if r['elapsed'] else 0.0 for r in results]
+    return result
+
+
+def format_report(result, symbols=SYMBOLS):
+    """Human readable summary of a simulate() result"""
+    lines = [f"Spins: {result['spins']:,}"]
+    for outcome in OUTCOMES:
+        count = result['counts'][outcome]
+        lines.append(f"  {outcome:<8} {count:>14,}  {result['rates'][outcome]:.6%}")
+    lines.append("Triples pro Symbol:")
+    for symbol, rate in zip(symbols, result['triple_rates']):
+        lines.append(f"  {symbol:<10} {rate:.6%}")
+    lines.append("Symbole (alle Walzen):")
+    for symbol, rate in zip(symbols, result['symbol_rates']):
+        lines.append(f"  {symbol:<10} {rate:.4%}")
+    lines.append("Preise:")
+    for prize, count in result['prize_counts'].items():
+        lines.append(f"  {count:>14,}  {prize}")
+    lines.append(f"Spins pro Jackpot: {result['spins_per_jackpot']:,.1f}")
+
+    if 'elapsed' in result:
+        elapsed = result['elapsed']
+        total_rate = result['spins'] / elapsed if elapsed else 0.0
+        lines.append(f"Seed: {result['seed']}")
+        lines.append(f"Dauer: {elapsed:.2f}s mit {result['workers']} Prozessen")
+        lines.append(f"Durchsatz: {total_rate:,.0f} Spins/s gesamt, "
+                     f"{total_rate / result['workers']:,.0f} Spins/s pro Kern")
+        rates = result['worker_rates']
+        lines.append(f"Pro Prozess: min {min(rates):,.0f} / max {max(rates):,.0f} Spins/s")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Command line entry point, also used by `python main.py simulate`"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="main.py simulate",
+                                     description="Monte-Carlo-Simulation der Slot Machine")
+    parser.add_argument('--spins', type=float, default=1e7, help="Anzahl Spins (z.B. 1e9)")
+    parser.add_argument('--workers', type=int, default=None, help="Prozesse (Standard: alle Kerne)")
+    parser.add_argument('--seed', type=int, default=None, help="Seed für reproduzierbare Läufe")
+    args = parser.parse_args(argv)
+
+    result = simulate_parallel(int(args.spins), args.workers, seed=args.seed)
+    print(format_report(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
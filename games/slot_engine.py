@@ -0,0 +1,311 @@
+"""Spin outcome engine for the slot machine.
+
+Everything needed to decide a spin lives here: symbols, weights, drawing
+the reels, classifying the result and picking the prize. The module does
+not import pygame, so simulations, servers and scripts can evaluate spins
+without a display or mixer. `SlotMachine` only adds sound, effects and the
+prize list on top.
+"""
+import functools
+import itertools
+import random
+
+# Symbols setup - Index 0 ist das Jackpot-Symbol
+SYMBOLS = ['Lugia', 'Charizard', 'Tyranitar', 'Gengar', 'Oshawott', 'Arcanine']
+# Neue Gewichtungen (Total: 100)
+DEFAULT_WEIGHTS = [5,      # Lugia (5%) - Realistischer
+                   23,     # Charizard (23%)
+                   23,     # Tyranitar (23%)
+                   23,     # Gengar (23%)
+                   13,     # Oshawott (13%)
+                   13]     # Arcanine (13%)
+# Im Config-Fenster gespeicherte Gewichtungen stehen in games/prizes.py
+try:
+    from games.prizes import WEIGHTS
+except ImportError:
+    WEIGHTS = DEFAULT_WEIGHTS
+if len(WEIGHTS) != len(SYMBOLS):
+    WEIGHTS = DEFAULT_WEIGHTS
+REELS = 3
+JACKPOT_SYMBOL = 0
+
+# Outcome classes - same keys as PrizeConfig.get_prizes()
+JACKPOT = 'jackpot'
+MAIN = 'main'
+DOUBLE = 'double'
+EASY = 'easy'
+OUTCOMES = (JACKPOT, MAIN, DOUBLE, EASY)
+
+NO_PRIZE = "Kein Preis konfiguriert"
+
+
+class AliasSampler:
+    """Weighted symbol draws in O(1) using Vose's alias method
+
+    Built once per weight configuration. Each draw uses a single uniform
+    random number: its integer part picks a column, the fractional part
+    decides between the column and its alias.
+    """
+
+    def __init__(self, weights=WEIGHTS):
+        self.weights = tuple(weights)
+        n = len(self.weights)
+        total = sum(self.weights)
+        scaled = [w * n / total for w in self.weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Rest ist (bis auf Rundungsfehler) genau 1.0
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def draw(self, rng=random):
+        """Draw one symbol index"""
+        u = rng.random() * len(self.prob)
+        column = int(u)
+        return column if u - column < self.prob[column] else self.alias[column]
+
+    def draw_many(self, k, rng=random):
+        """Draw k symbol indices"""
+        n = len(self.prob)
+        prob = self.prob
+        alias = self.alias
+        draws = []
+        for _ in range(k):
+            u = rng.random() * n
+            column = int(u)
+            draws.append(column if u - column < prob[column] else alias[column])
+        return draws
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_sampler(weights):
+    return AliasSampler(weights)
+
+
+def sampler(weights=WEIGHTS):
+    """Shared AliasSampler, rebuilt only when the weights change"""
+    return _cached_sampler(tuple(weights))
+
+
+def spin(weights=WEIGHTS, reels=REELS, rng=random):
+    """Draw one symbol index per reel"""
+    return sampler(weights).draw_many(reels, rng)
+
+
+def classify(reels):
+    """Return (outcome, symbol) for a list of symbol indices
+
+    `symbol` is the matching symbol for jackpot, main and double wins and
+    None when nothing matches.
+    """
+    counts = {}
+    for symbol in reels:
+        counts[symbol] = counts.get(symbol, 0) + 1
+
+    # 3x Lugia (Jackpot)
+    if counts.get(JACKPOT_SYMBOL, 0) == len(reels):
+        return JACKPOT, JACKPOT_SYMBOL
+
+    # 3x ein anderes Symbol
+    for symbol, count in counts.items():
+        if count == len(reels):
+            return MAIN, symbol
+
+    # 2x (oder mehr, bei mehr als 3 Walzen) ein beliebiges Symbol
+    for symbol, count in counts.items():
+        if count >= 2:
+            return DOUBLE, symbol
+
+    return EASY, None
+
+
+class OutcomeTable:
+    """Every reel combination with its outcome class and exact probability
+
+    A spin is encoded as a base-`len(weights)` number with the first reel
+    as the most significant digit, so classifying a spin is one index into
+    `outcomes`. With 6 symbols and 3 reels that is 216 entries; the table
+    is enumerated, not sampled, so all probabilities are exact.
+    """
+
+    def __init__(self, weights=WEIGHTS, reels=REELS):
+        self.weights = tuple(weights)
+        self.reels = reels
+        self.num_symbols = len(self.weights)
+        total = sum(self.weights)
+        symbol_probabilities = [w / total for w in self.weights]
+
+        self.outcomes = []       # Outcome class per code
+        self.outcome_index = []  # Index into OUTCOMES per code
+        self.symbols = []        # Matching symbol per code (or None)
+        self.probabilities = []  # Exact probability per code
+        self.class_probabilities = dict.fromkeys(OUTCOMES, 0.0)
+        self.triple_probabilities = [0.0] * self.num_symbols
+
+        for combo in itertools.product(range(self.num_symbols), repeat=reels):
+            outcome, symbol = classify(combo)
+            probability = 1.0
+            for s in combo:
+                probability *= symbol_probabilities[s]
+            self.outcomes.append(outcome)
+            self.outcome_index.append(OUTCOMES.index(outcome))
+            self.symbols.append(symbol)
+            self.probabilities.append(probability)
+            self.class_probabilities[outcome] += probability
+            if outcome in (JACKPOT, MAIN):
+                self.triple_probabilities[symbol] += probability
+
+    def encode(self, reels):
+        """Encode a list of symbol indices as table index"""
+        code = 0
+        for symbol in reels:
+            code = code * self.num_symbols + symbol
+        return code
+
+    def classify(self, reels):
+        """Same result as classify(), as a single table lookup"""
+        code = self.encode(reels)
+        return self.outcomes[code], self.symbols[code]
+
+    def probability(self, outcome):
+        """Exact probability of an outcome class"""
+        return self.class_probabilities[outcome]
+
+    @property
+    def jackpot_probability(self):
+        return self.class_probabilities[JACKPOT]
+
+    @property
+    def triple_probability(self):
+        """Any three of a kind, the jackpot included"""
+        return self.class_probabilities[JACKPOT] + self.class_probabilities[MAIN]
+
+    @property
+    def double_probability(self):
+        return self.class_probabilities[DOUBLE]
+
+
+class OddsPreview:
+    """Class probabilities kept up to date while single weights change
+
+    For 3 reels the class sums of OutcomeTable are power sums of the
+    weights (W = total):
+
+        jackpot = w0^3 / W^3
+        main    = (sum w^3 - w0^3) / W^3
+        double  = 3 * (sum w^2 * W - sum w^3) / W^3
+
+    set_weight() adjusts W, sum w^2 and sum w^3 in O(1), so an editor can
+    refresh the odds on every keystroke. Agrees with outcome_table() for
+    the same weights.
+    """
+
+    def __init__(self, weights=WEIGHTS, reels=REELS):
+        if reels != 3:
+            raise ValueError("OddsPreview assumes 3 reels")
+        self.weights = list(weights)
+        self.total = sum(self.weights)
+        self.s2 = sum(w * w for w in self.weights)
+        self.s3 = sum(w * w * w for w in self.weights)
+
+    def set_weight(self, index, weight):
+        """Replace one weight and update the sums"""
+        old = self.weights[index]
+        self.weights[index] = weight
+        self.total += weight - old
+        self.s2 += weight * weight - old * old
+        self.s3 += weight * weight * weight - old * old * old
+
+    @property
+    def valid(self):
+        return self.total > 0 and all(w >= 0 for w in self.weights)
+
+    def class_probabilities(self):
+        """Same keys and values as OutcomeTable.class_probabilities"""
+        if not self.valid:
+            return dict.fromkeys(OUTCOMES, 0.0)
+        cube = self.total ** 3
+        w0 = self.weights[JACKPOT_SYMBOL]
+        jackpot = w0 ** 3 / cube
+        triple = self.s3 / cube
+        double = 3 * (self.s2 * self.total - self.s3) / cube
+        return {
+            JACKPOT: jackpot,
+            MAIN: triple - jackpot,
+            DOUBLE: double,
+            EASY: max(0.0, 1.0 - triple - double)
+        }
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_table(weights, reels):
+    return OutcomeTable(weights, reels)
+
+
+def outcome_table(weights=WEIGHTS, reels=REELS):
+    """Shared OutcomeTable, built once per weight set"""
+    return _cached_table(tuple(weights), reels)
+
+
+def current_prizes():
+    """Read the configured prizes from games.prizes"""
+    from games import prizes
+    return {
+        'jackpot': prizes.JACKPOT_PRIZE,
+        'main': prizes.MAIN_PRIZES,
+        'double': prizes.DOUBLE_PRIZES,
+        'easy': prizes.EASY_PRIZES
+    }
+
+
+def pick_prize(outcome, symbol, prizes=None, rng=random):
+    """Pick the prize for a classified spin
+
+    `prizes` uses the layout of PrizeConfig.get_prizes(); defaults to the
+    lists in games.prizes.
+    """
+    if prizes is None:
+        prizes = current_prizes()
+
+    if outcome == JACKPOT:
+        return prizes['jackpot'] or NO_PRIZE
+    if outcome == MAIN:
+        main = prizes['main']
+        return main[symbol - 1] if 0 < symbol <= len(main) else NO_PRIZE
+
+    pool = prizes[outcome]
+    return rng.choice(pool) if pool else NO_PRIZE
+
+
+def evaluate(reels, prizes=None, rng=random, table=None):
+    """Classify a spin and pick its prize in one go"""
+    table = table if table is not None else outcome_table()
+    outcome, symbol = table.classify(reels)
+    return outcome, symbol, pick_prize(outcome, symbol, prizes, rng)
+
+
+def replay_session(seed, spins, weights=WEIGHTS, prizes=None):
+    """Replay the first `spins` spins of a SlotMachine session
+
+    Uses the outcome stream of RNGService(seed) in the same order as the
+    game: the reels are drawn at spin start, the prize when they stop.
+    Yields (reels, outcome, prize) per spin.
+    """
+    from games.rng import RNGService
+    stream = RNGService(seed).outcome
+    spin_sampler = sampler(weights)
+    table = outcome_table(weights)
+    for _ in range(spins):
+        reels = spin_sampler.draw_many(REELS, stream)
+        outcome, _symbol, prize = evaluate(reels, prizes, stream, table)
+        yield reels, outcome, prize
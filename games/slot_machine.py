@@ -1,6 +1,4 @@
 import pygame
-import random
-import os
 import math
 import time
 from utils.constants import *
@@ -9,13 +7,32 @@ from utils.ui_elements import Button, InfoBox, PrizeConfig, ParticleSystem, Slot
 from games.prizes import JACKPOT_PRIZE, MAIN_PRIZES, DOUBLE_PRIZES, EASY_PRIZES
 from utils.sound_manager import SoundManager
 from utils.game_base import BaseGame
+from utils.render_cache import ScaledSpriteCache, GlowPool
+from utils.reel_strip import ReelStrip
+from utils.asset_cache import AssetCache
 from games.constants import MAIN_HITS, EASY_WINS, MEDIUM_WINS, HARD_WINS, COMMUNITY_JACKPOT
-import sys
+from games import slot_engine
+from games.rng import RNGService
 
 class SlotMachine(BaseGame):
-    def __init__(self, screen):
+    # Symbole und Gewichtungen kommen aus der Engine (games/slot_engine.py)
+    SYMBOLS = slot_engine.SYMBOLS
+    WEIGHTS = slot_engine.WEIGHTS
+    SPRITE_SIZE = (130, 130)  # Sprites werden beim Laden auf diese Größe gebracht
+    SOUND_FILES = {
+        'spin': 'spin.wav',
+        'stop': 'stop.wav',
+        'win': 'win.wav',
+        'jackpot': 'jackpot.wav'
+    }
+    MUSIC_FILE = '1-11-Route-101.wav'
+
+    def __init__(self, screen, seed=None):
         super().__init__(screen)  # Initialize BaseGame
         self.screen = screen
+        # Getrennte Zufallsströme für Ergebnis und Effekte; Seed wird protokolliert
+        self.rng = RNGService(seed)
+        print(f"Slot machine RNG seed: {self.rng.seed}")
         self.last_update = pygame.time.get_ticks()
         self.font_manager = FontManager()
         
@@ -23,13 +40,25 @@ class SlotMachine(BaseGame):
         self.slots = [0, 0, 0]
         self.rolling = False
         self.roll_time = 0
+        self.result = None  # Beim Start des Spins festgelegtes Ergebnis
         self.jackpot_animation = 0
         self.glow_effect = 0
         self.shake_offset = 0
         self.flash_effect = 0
+        self._previous_effects = (0, 0)  # Glow und Shake beim letzten Tick
         self.current_challenge = None
         self.challenges_completed = set()
         self.spin_count = 0  # Zähler für Spins
+        self.show_stats = False  # F3: Cache-Statistiken einblenden
+        # Zuletzt gezeichneter Zustand, für die Dirty-Rects
+        self._drawn_scene_state = None
+        self._drawn_reel_state = None
+        self._particle_bounds = None
+        self._background = {}  # Statischer Hintergrund, siehe get_background()
+        self._background_key = None
+        self.glow_pool = GlowPool()  # Vorgerenderte Glow-Flächen für Gewinneffekte
+        self.outcome_table = slot_engine.outcome_table(self.WEIGHTS)
+        self.sampler = slot_engine.sampler(self.WEIGHTS)
         
         # Initialize UI elements first
         self.init_ui()
@@ -42,10 +71,12 @@ class SlotMachine(BaseGame):
         self.slots = [0, 0, 0]
         self.rolling = False
         self.roll_time = 0
+        self.result = None
         self.jackpot_animation = 0
         self.glow_effect = 0
         self.shake_offset = 0
         self.flash_effect = 0
+        self._previous_effects = (0, 0)
         self.current_challenge = None
         self.challenges_completed = set()
         self.spin_count = 0  # Reset Zähler für Spins
@@ -54,16 +85,6 @@ class SlotMachine(BaseGame):
         
     def init_resources(self):
         """Initialize all game resources"""
-        # Symbols setup
-        self.SYMBOLS = ['Lugia', 'Charizard', 'Tyranitar', 'Gengar', 'Oshawott', 'Arcanine']
-        # Neue Gewichtungen (Total: 100)
-        self.WEIGHTS = [5,      # Lugia (5%) - Realistischer
-                       23,      # Charizard (23%)
-                       23,      # Tyranitar (23%)
-                       23,      # Gengar (23%)
-                       13,      # Oshawott (13%)
-                       13]      # Arcanine (13%)
-        
         # Initialize fonts
         self.title_font = self.font_manager.get_font('title')
         self.normal_font = self.font_manager.get_font('normal')
@@ -72,20 +93,17 @@ class SlotMachine(BaseGame):
         self.sound_manager = SoundManager()
         self.particle_system = ParticleSystem()
         
-        # Load sprites
+        # Load sprites (einmal pro Datei, über den gemeinsamen Asset-Cache)
+        assets = AssetCache()
+        for sprite in getattr(self, 'sprite_assets', {}).values():
+            assets.release(sprite)
+        self.sprite_assets = {}
         self.sprites = {}
         for symbol in self.SYMBOLS:
             try:
-                # Get the base path for assets
-                if getattr(sys, 'frozen', False):
-                    # Running as compiled executable
-                    base_path = sys._MEIPASS
-                else:
-                    # Running in development
-                    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                
-                sprite_path = os.path.join(base_path, 'assets', 'sprites', f'{symbol.lower()}.png')
-                self.sprites[symbol] = pygame.image.load(sprite_path).convert_alpha()
+                sprite = assets.sprite(f'{symbol.lower()}.png')
+                self.sprite_assets[symbol] = sprite
+                self.sprites[symbol] = pygame.transform.scale(sprite, self.SPRITE_SIZE)
             except Exception as e:
                 print(f"Error loading sprite {symbol}: {str(e)}")
                 # Use a default sprite or placeholder
@@ -93,37 +111,20 @@ class SlotMachine(BaseGame):
                 self.sprites[symbol].fill(RED)
         
         # Load sounds
-        sound_files = {
-            'spin': 'spin.wav',
-            'stop': 'stop.wav',
-            'win': 'win.wav',
-            'jackpot': 'jackpot.wav'
-        }
-        for name, file in sound_files.items():
+        for name, file in self.SOUND_FILES.items():
             self.sound_manager.load_sound(name, file)
         
         # Set title font from font manager
         self.title_font = self.font_manager.get_font('huge')  # Use huge size for title
         
-        # Load and scale sprites
-        for symbol in self.SYMBOLS:
-            try:
-                # Get the base path for assets
-                if getattr(sys, 'frozen', False):
-                    # Running as compiled executable
-                    base_path = sys._MEIPASS
-                else:
-                    # Running in development
-                    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                
-                sprite_path = os.path.join(base_path, 'assets', 'sprites', f'{symbol.lower()}.png')
-                sprite = pygame.image.load(sprite_path).convert_alpha()
-                self.sprites[symbol] = pygame.transform.scale(sprite, (130, 130))
-            except Exception as e:
-                print(f"Error loading sprite {symbol}: {e}")
+        # Skalierte Sprites werden nur einmal pro Größe erzeugt
+        self.sprite_cache = ScaledSpriteCache(
+            self.sprites, prescaled=lambda symbol, size: assets.prescaled(f'{symbol.lower()}.png', size))
+        for strip in getattr(self, 'reel_strips', []):
+            strip.invalidate()
         
         # Start background music
-        self.sound_manager.load_music('background', '1-11-Route-101.wav')
+        self.sound_manager.load_music('background', self.MUSIC_FILE)
         self.sound_manager.play_music('background')
         
         # Initialize prize list
@@ -135,12 +136,9 @@ class SlotMachine(BaseGame):
             self.normal_font
         )
         self.won_prizes_list.slot_machine = self  # Setze Referenz zur SlotMachine
+        self.won_prizes_list.seed = self.rng.seed
         self.won_prizes_list.load_prizes()
         
-        # Update positions based on screen size
-        if hasattr(self, 'scale_x'):
-            self.won_prizes_list.update_position(self.scale_x, self.scale_y)
-        
     def init_ui(self):
         """Initialize all UI elements"""
         # Button dimensions and positioning
@@ -207,6 +205,13 @@ class SlotMachine(BaseGame):
             x = slot_start_x + (i * (slot_size + slot_spacing))
             self.slots.append(Slot(x, slot_y, slot_size))
         
+        # Walzenstreifen, jede Walze mit eigener Symbolreihenfolge
+        self.reel_strips = []
+        for slot in self.slots:
+            order = list(range(len(self.SYMBOLS)))
+            self.rng.cosmetic.shuffle(order)
+            self.reel_strips.append(ReelStrip(order, slot.symbol))
+        
         # Create info box with responsive size
         info_width = int(SCREEN_WIDTH * 0.5)  # 50% of screen width
         info_height = int(SCREEN_HEIGHT * 0.6)  # 60% of screen height
@@ -231,6 +236,10 @@ class SlotMachine(BaseGame):
             self.font_manager.get_font('normal')
         )
         
+        self.update_info_text()
+        
+    def update_info_text(self):
+        """Fill the info box; odds come from the current outcome table"""
         # Define colors for different challenge levels
         easy_color = (150, 255, 150)      # Light green
         medium_color = (150, 150, 255)    # Light blue
@@ -238,7 +247,8 @@ class SlotMachine(BaseGame):
         jackpot_color = (255, 215, 0)     # Gold
         white = (255, 255, 255)           # White
         
-        # Set info text with colors
+        # Set info text with colors - Chancen kommen aus der exakten Tabelle
+        table = self.outcome_table
         self.info_box.set_text([
             ("🎰 POKEMON CARD SLOT", jackpot_color),
             ("", white),
@@ -249,28 +259,38 @@ class SlotMachine(BaseGame):
             ("💫 GEWINNE & CHANCEN", white),
             ("• Verschiedene Symbole", easy_color),
             ("  1x Japanisches Boosterpack", (200, 200, 200)),
+            (self.odds_text(table.probability(slot_engine.EASY)), (180, 180, 180)),
             ("", white),
             ("• 2x Gleiche Symbole", medium_color),
             ("  70% = 3x Japanische Booster", (200, 200, 200)),
             ("  30% = Illustration/Secret Rare", (200, 200, 200)),
-            ("  Chance: ~48% (Fast jeder 2. Spin)", (180, 180, 180)),
+            (self.odds_text(table.probability(slot_engine.DOUBLE)), (180, 180, 180)),
             ("", white),
             ("• 3x Gleiche Symbole", hard_color),
             ("  Pokemon Karte im Wert", (200, 200, 200)),
             ("  von bis zu 25€!", (200, 200, 200)),
-            ("  Chance: ~4% (Etwa alle 25 Spins)", (180, 180, 180)),
+            (self.odds_text(table.probability(slot_engine.MAIN)), (180, 180, 180)),
             ("", white),
             ("🏆 HAUPTGEWINN", jackpot_color),
             ("• 3x Lugia = Hauptpreis", (255, 223, 0)),
             ("• Aktuell:", (255, 223, 0)),
             (f"  {JACKPOT_PRIZE}", (255, 223, 0)),
-            ("  Chance: ~0.01% (Etwa alle 125 Spins)", (255, 223, 0)),
+            (self.odds_text(table.probability(slot_engine.JACKPOT)), (255, 223, 0)),
             ("", white),
             ("💡 TIPP", white),
             ("Jeder Spin gewinnt mindestens", (200, 200, 200)),
             ("ein japanisches Boosterpack!", (200, 200, 200))
         ])
         
+    @staticmethod
+    def odds_text(probability):
+        """Format an exact probability for the info box"""
+        if probability <= 0:
+            return "  Chance: 0%"
+        spins = 1 / probability
+        every = f"Etwa alle {spins:,.0f} Spins".replace(',', '.') if round(spins) >= 2 else "Fast jeder Spin"
+        return f"  Chance: ~{probability * 100:.2g}% ({every})"
+        
     def process_event(self, event):
         """Handle all game events"""
         if event.type == pygame.QUIT:
@@ -298,6 +318,8 @@ class SlotMachine(BaseGame):
                     if prizes['easy']:
                         global EASY_PRIZES
                         EASY_PRIZES[:] = prizes['easy']
+                    if prizes['weights']:
+                        self.apply_weights(prizes['weights'])
                 return
                 
             if self.won_prizes_list.handle_event(event):
@@ -341,6 +363,8 @@ class SlotMachine(BaseGame):
             elif event.key == pygame.K_F11:  # F11 für Vollbild
                 self.is_fullscreen = not self.is_fullscreen
                 self.init_display()
+            elif event.key == pygame.K_F3:
+                self.show_stats = not self.show_stats
             elif event.key == pygame.K_ESCAPE:
                 self.running = False
                 
@@ -351,20 +375,55 @@ class SlotMachine(BaseGame):
             self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
             self.actual_width = event.w
             self.actual_height = event.h
-            self.scale_x = self.actual_width / SCREEN_WIDTH
-            self.scale_y = self.actual_height / SCREEN_HEIGHT
-            self.init_resources()
-            return True
+            # Nur größenabhängige Caches neu bauen, Assets und Preisliste bleiben
+            self.on_resize()
+
+    def on_resize(self):
+        """Rebuild the size-dependent caches after a resize or fullscreen toggle
+
+        Scaled sprites, reel strips and the background layer are rebuilt
+        for the new screen; sprites, sounds, music and the won prizes list
+        stay loaded. The duration ends up in self.resize_time (F3 overlay).
+        """
+        start = time.perf_counter()
+        self.renderer.set_screen(self.screen)
+        self.sprite_cache.invalidate()
+        for strip in self.reel_strips:
+            strip.invalidate()
+        self.invalidate_background()
+        slot_size, _ = self.reel_layout()
+        self.build_reel_strips(slot_size)
+        self.get_background()
+        self.resize_time = time.perf_counter() - start
+
+    def resume(self):
+        """Back from the menu: keep everything loaded, restart the music"""
+        super().resume()
+        if not pygame.mixer.music.get_busy():
+            self.sound_manager.play_music('background')
+
+    def apply_weights(self, weights):
+        """Use new symbol weights for the following spins"""
+        if list(weights) == list(self.WEIGHTS):
+            return
+        self.WEIGHTS = list(weights)
+        self.outcome_table = slot_engine.outcome_table(self.WEIGHTS)
+        self.sampler = slot_engine.sampler(self.WEIGHTS)
+        self.update_info_text()
 
     def start_spin(self):
         if not self.rolling:
             self.spin_count += 1  # Erhöhe Zähler bei jedem Spin
             self.rolling = True
             self.roll_time = 0
+            # Ergebnis wird genau hier gezogen, die Animation läuft nur darauf zu
+            self.result = self.sampler.draw_many(len(self.slots), self.rng.outcome)
+            for i, strip in enumerate(self.reel_strips):
+                strip.spin_to(self.result[i], self.reel_stop_time(i), REEL_SPIN_SPEED)
             self.current_challenge = None
             self.sound_manager.play_sound('spin')
             
-    def create_win_effects(self):
+    def create_win_effects(self, jackpot=False):
         """Create visual effects for winning"""
         self.glow_effect = 30
         self.shake_offset = 5
@@ -373,70 +432,90 @@ class SlotMachine(BaseGame):
         
         # Create particles at random positions around the winning symbols
         for i in range(20):  # Number of particles
-            x = random.randint(200, 600)
-            y = random.randint(100, 300)
+            x = self.rng.cosmetic.randint(200, 600)
+            y = self.rng.cosmetic.randint(100, 300)
             color = (255, 215, 0, 255)  # Gold color with alpha
-            velocity = [random.uniform(-100, 100), random.uniform(-100, 100)]
+            velocity = [self.rng.cosmetic.uniform(-100, 100), self.rng.cosmetic.uniform(-100, 100)]
             self.particle_system.add_particle(
                 x, y, color, velocity,
                 lifetime=1.0, size=3
             )
 
+        if jackpot:
+            self.create_fireworks()
+
+    def create_fireworks(self, bursts=JACKPOT_FIREWORK_BURSTS, particles=JACKPOT_FIREWORK_PARTICLES):
+        """Radial firework bursts over the whole screen for the jackpot"""
+        cosmetic = self.rng.cosmetic
+        width, height = self.screen.get_size()
+        colors = [(255, 215, 0, 255), (255, 255, 255, 255), (255, 120, 60, 255), (120, 200, 255, 255)]
+        for _ in range(bursts):
+            cx = cosmetic.uniform(width * 0.15, width * 0.85)
+            cy = cosmetic.uniform(height * 0.1, height * 0.5)
+            color = cosmetic.choice(colors)
+            for _ in range(particles):
+                angle = cosmetic.uniform(0, 2 * math.pi)
+                speed = cosmetic.uniform(60, 260)
+                self.particle_system.add_particle(
+                    cx, cy, color, (math.cos(angle) * speed, math.sin(angle) * speed),
+                    lifetime=cosmetic.uniform(1.0, 2.0), size=cosmetic.randint(2, 4)
+                )
+
+    def get_prizes(self):
+        """Current prize configuration in the layout of PrizeConfig.get_prizes()"""
+        return {
+            'jackpot': JACKPOT_PRIZE,
+            'main': MAIN_PRIZES,
+            'double': DOUBLE_PRIZES,
+            'easy': EASY_PRIZES
+        }
+
     def check_win(self):
         """Check win condition and return prize"""
-        # Count symbols
-        counts = {}
-        for slot in self.slots:
-            symbol = slot.symbol
-            counts[symbol] = counts.get(symbol, 0) + 1
-            
-        # Check for 3 Lugia (Jackpot)
-        if counts.get(0, 0) == 3:  # Lugia ist Index 0
+        reels = [slot.symbol for slot in self.slots]
+        outcome, symbol, prize = slot_engine.evaluate(reels, self.get_prizes(), self.rng.outcome, self.outcome_table)
+
+        if outcome == slot_engine.JACKPOT:
             self.sound_manager.play_sound('jackpot')
-            self.create_win_effects()
-            win_text = f" HAUPTGEWINN!\n• {JACKPOT_PRIZE}\n• Herzlichen Glückwunsch!"
-            self.won_prizes_list.add_prize(f"Jackpot: {JACKPOT_PRIZE}")
+            self.create_win_effects(jackpot=True)
+            win_text = f" HAUPTGEWINN!\n• {prize}\n• Herzlichen Glückwunsch!"
+            self.won_prizes_list.add_prize(f"Jackpot: {prize}")
             return win_text
-            
-        # Check for 3 of any other symbol
-        for symbol, count in counts.items():
-            if count == 3:
-                prize = MAIN_PRIZES[symbol - 1] if symbol > 0 and symbol <= len(MAIN_PRIZES) else "Kein Preis konfiguriert"
-                self.sound_manager.play_sound('win')
-                self.create_win_effects()
-                symbol_name = self.SYMBOLS[symbol]
-                win_text = f" SUPER GEWINN!\n• 3x {symbol_name}\n• {prize}"
-                self.won_prizes_list.add_prize(f"{symbol_name}: {prize}")
-                return win_text
-                
-        # Check for 2 of any symbol
-        for symbol, count in counts.items():
-            if count == 2:
-                prize = random.choice(DOUBLE_PRIZES) if DOUBLE_PRIZES else "Kein Preis konfiguriert"
-                self.sound_manager.play_sound('win')
-                return f" GEWONNEN!\n• {prize}\n• Viel Spaß!"
-                
-        # No matches
-        prize = random.choice(EASY_PRIZES) if EASY_PRIZES else "Kein Preis konfiguriert"
+
         self.sound_manager.play_sound('win')
+        if outcome == slot_engine.MAIN:
+            self.create_win_effects()
+            symbol_name = self.SYMBOLS[symbol]
+            win_text = f" SUPER GEWINN!\n• 3x {symbol_name}\n• {prize}"
+            self.won_prizes_list.add_prize(f"{symbol_name}: {prize}")
+            return win_text
+
+        # 2 gleiche Symbole oder keine Übereinstimmung
         return f" GEWONNEN!\n• {prize}\n• Viel Spaß!"
 
-    def update(self):
-        # Calculate delta time
-        current_time = pygame.time.get_ticks()
-        dt = (current_time - self.last_update) / 1000.0  # Convert to seconds
-        self.last_update = current_time
+    def reel_stop_time(self, index):
+        """Time after the spin start at which reel `index` lands (staggered stops)"""
+        return ROLL_DURATION - (len(self.slots) - 1 - index) * ROLL_STAGGER
+
+    def tick(self, dt):
+        """One fixed logic step (see BaseGame.advance)"""
+        self._previous_effects = (self.glow_effect, self.shake_offset)
 
         if self.rolling:
-            self.roll_time += dt
+            # Auf dem Tick-Raster halten, damit 2.5 s auch genau 300 Ticks sind
+            self.roll_time = round((self.roll_time + dt) * self.tick_rate) / self.tick_rate
             
-            # Update slots
-            for i in range(len(self.slots)):
-                if self.roll_time > i * 0.5:  # Stagger the slot stops
-                    self.slots[i].symbol = random.choices(range(len(self.SYMBOLS)), weights=self.WEIGHTS)[0]
+            # Walzen laufen auf das beim Start gezogene Ergebnis zu
+            for i, slot in enumerate(self.slots):
+                strip = self.reel_strips[i]
+                strip.position = strip.position_at(self.roll_time)
+                if self.roll_time < self.reel_stop_time(i):
+                    slot.symbol = strip.symbol_at(strip.position)
+                else:
+                    slot.symbol = self.result[i]
             
             # Check if rolling should stop
-            if self.roll_time >= 2.5:  # Total roll time
+            if self.roll_time >= ROLL_DURATION:  # Total roll time
                 self.rolling = False
                 self.sound_manager.play_sound('stop')
                 self.current_challenge = self.check_win()
@@ -451,67 +530,122 @@ class SlotMachine(BaseGame):
         
         # Update effects
         if self.glow_effect > 0:
-            self.glow_effect = max(0, self.glow_effect - 1)
+            self.glow_effect = max(0, self.glow_effect - GLOW_DECAY * dt)
         if self.shake_offset > 0:
-            self.shake_offset = max(0, self.shake_offset - 0.5)
+            self.shake_offset = max(0, self.shake_offset - SHAKE_DECAY * dt)
         if self.flash_effect > 0:
-            self.flash_effect = max(0, self.flash_effect - 1)
+            self.flash_effect = max(0, self.flash_effect - FLASH_DECAY * dt)
         if self.jackpot_animation > 0:
-            self.jackpot_animation = max(0, self.jackpot_animation - 2)
-        
+            self.jackpot_animation = max(0, self.jackpot_animation - JACKPOT_ANIMATION_DECAY * dt)
+
+    def effect_levels(self):
+        """Glow and shake interpolated between the last two ticks"""
+        previous_glow, previous_shake = self._previous_effects
+        return (self.interpolate(previous_glow, self.glow_effect),
+                self.interpolate(previous_shake, self.shake_offset))
+        
+    def is_animating(self):
+        """True while reels, effects or particles move (see BaseGame.next_events)"""
+        return (self.rolling or self.glow_effect > 0 or self.shake_offset > 0
+                or any(self._previous_effects)
+                or self.flash_effect > 0 or self.jackpot_animation > 0
+                or len(self.particle_system) > 0 or self.renderer.dirty)
+
+    def title_surface(self):
+        """Rendered title and its rect"""
+        title = FontManager.render(self.title_font, "Arteus Pokémon Slot", GOLD)
+        title_rect = title.get_rect(center=(SCREEN_WIDTH//2, int(SCREEN_HEIGHT * 0.1)))  # 10% from top
+        return title, title_rect
+
+    def draw_reel_frame(self, surface, slot_x, slot_y, slot_size):
+        """White border and black inner area of one reel"""
+        pygame.draw.rect(surface, WHITE, (slot_x-5, slot_y-5, slot_size+10, slot_size+10), border_radius=15)
+        pygame.draw.rect(surface, BLACK, (slot_x, slot_y, slot_size, slot_size), border_radius=12)
+
+    def get_background(self, static_reels=True):
+        """Cached layer with everything that does not change per frame
+
+        Title, reel frames, buttons and the prize list panel are composited
+        once. The layer is rebuilt when the screen size or a button's hover
+        state changes. While win effects shake and glow the reels, the
+        variant without title and reel frames is used and those are drawn
+        per frame.
+        """
+        buttons = (self.back_button, self.info_button, self.spin_button, self.config_button)
+        key = (self.screen.get_size(),
+               tuple((b.is_hovered, b.text, b.color, b.rect.topleft) for b in buttons))
+        if key != self._background_key:
+            self._background = {}
+            self._background_key = key
+        
+        if static_reels not in self._background:
+            surface = pygame.Surface(self.screen.get_size()).convert()
+            surface.fill(BLACK)
+            if static_reels:
+                title, title_rect = self.title_surface()
+                surface.blit(title, title_rect)
+                slot_size, positions = self.reel_layout()
+                for slot_x, slot_y in positions:
+                    self.draw_reel_frame(surface, slot_x, slot_y, slot_size)
+            for button in buttons:
+                button.draw(surface)
+            self.won_prizes_list.draw_background(surface)
+            self._background[static_reels] = surface
+        return self._background[static_reels]
+
+    def invalidate_background(self):
+        """Force the background layer to be rebuilt (resize, config change)"""
+        self._background = {}
+        self._background_key = None
+        self.renderer.invalidate()
+
     def draw(self):
         """Draw the game state"""
         try:
-            # Draw background
-            self.screen.fill(BLACK)
-            
-            # Calculate responsive title position
-            title_y = int(SCREEN_HEIGHT * 0.1)  # 10% from top
-            
-            # Draw title with glow effect
-            title = self.title_font.render("Arteus Pokémon Slot", True, GOLD)
-            title_rect = title.get_rect(center=(SCREEN_WIDTH//2, title_y))
+            # Statischer Hintergrund in einem Blit
+            glow, shake = self.effect_levels()
+            effects = glow > 0 or shake > 0
+            self.screen.blit(self.get_background(static_reels=not effects), (0, 0))
             
-            # Add title glow effect
-            if self.glow_effect > 0:
-                glow_surface = pygame.Surface((title.get_width() + 20, title.get_height() + 20), pygame.SRCALPHA)
-                glow_color = (*GOLD, int(128 * (self.glow_effect / 30)))
-                pygame.draw.rect(glow_surface, glow_color, glow_surface.get_rect(), border_radius=10)
-                self.screen.blit(glow_surface, (title_rect.x - 10, title_rect.y - 10))
-            
-            self.screen.blit(title, title_rect)
+            if effects:
+                # Draw title with glow effect
+                title, title_rect = self.title_surface()
+                if glow > 0:
+                    glow_surface = self.glow_pool.get((title.get_width() + 20, title.get_height() + 20),
+                                                      GOLD, 128 * (glow / 30), radius=10)
+                    self.screen.blit(glow_surface, (title_rect.x - 10, title_rect.y - 10))
+                self.screen.blit(title, title_rect)
             
             # Calculate responsive slot positions
-            slot_size = int(min(SCREEN_WIDTH * 0.15, SCREEN_HEIGHT * 0.25))  # Responsive slot size
-            slot_spacing = int(slot_size * 1.2)  # Space between slots
-            slot_y = SCREEN_HEIGHT//2 - slot_size//2
+            slot_size, positions = self.reel_layout()
+            slot_y = positions[0][1]
+            self.build_reel_strips(slot_size)
+            reel_positions = self.reel_positions()
             
             # Draw slot machine
+            reel_blits = []
             for i in range(3):
-                slot_x = SCREEN_WIDTH//2 - slot_spacing + 150 + (i-1)*slot_spacing
-                
-                # Add shake effect
-                if self.shake_offset:
-                    slot_x += random.randint(-int(self.shake_offset), int(self.shake_offset))
-                    slot_y += random.randint(-int(self.shake_offset), int(self.shake_offset))
+                slot_x = positions[i][0]
                 
-                # Draw slot background with glow effect
-                glow_size = self.glow_effect if self.glow_effect > 0 else 0
-                if glow_size:
-                    glow_surface = pygame.Surface((slot_size + glow_size*2, slot_size + glow_size*2), pygame.SRCALPHA)
-                    pygame.draw.rect(glow_surface, (*GOLD, 128), glow_surface.get_rect(), border_radius=15)
-                    self.screen.blit(glow_surface, (slot_x-5-glow_size, slot_y-5-glow_size))
-                
-                # Draw slot border with improved styling
-                pygame.draw.rect(self.screen, WHITE, (slot_x-5, slot_y-5, slot_size+10, slot_size+10), border_radius=15)
-                pygame.draw.rect(self.screen, BLACK, (slot_x, slot_y, slot_size, slot_size), border_radius=12)
+                if effects:
+                    # Add shake effect
+                    if shake:
+                        slot_x += self.rng.cosmetic.randint(-int(shake), int(shake))
+                        slot_y += self.rng.cosmetic.randint(-int(shake), int(shake))
+                    
+                    # Draw slot background with glow effect
+                    glow_size = int(glow) if glow > 0 else 0
+                    if glow_size:
+                        glow_surface = self.glow_pool.get((slot_size + glow_size*2, slot_size + glow_size*2),
+                                                          GOLD, 128, radius=15)
+                        self.screen.blit(glow_surface, (slot_x-5-glow_size, slot_y-5-glow_size))
+                    
+                    self.draw_reel_frame(self.screen, slot_x, slot_y, slot_size)
                 
-                # Draw sprite with proper scaling
-                symbol = self.SYMBOLS[self.slots[i].symbol]
-                if symbol in self.sprites:
-                    sprite = pygame.transform.scale(self.sprites[symbol], (slot_size-20, slot_size-20))
-                    sprite_rect = sprite.get_rect(center=(slot_x + slot_size//2, slot_y + slot_size//2))
-                    self.screen.blit(sprite, sprite_rect)
+                # Ein Ausschnitt pro Walze aus dem vorgerenderten Streifen
+                reel_blits.append(self.reel_strips[i].blit_args(slot_x, slot_y, reel_positions[i]))
+            # Alle Walzen in einem Aufruf
+            self.screen.blits(reel_blits, doreturn=False)
             
             # Draw current challenge with improved positioning
             if self.current_challenge:
@@ -526,34 +660,23 @@ class SlotMachine(BaseGame):
                 for i, line in enumerate(lines):
                     # Größere Schrift für Überschriften (erste Zeile jeder Challenge)
                     if i == 0:
-                        text = self.font_manager.get_font('subtitle').render(line, True, GOLD)
+                        text = FontManager.render(self.font_manager.get_font('subtitle'), line, GOLD)
                     # Kleinere Schrift für Details (mit Aufzählungszeichen)
                     else:
-                        text = challenge_font.render(line, True, WHITE)
+                        text = FontManager.render(challenge_font, line, WHITE)
                     
                     text_rect = text.get_rect(center=(SCREEN_WIDTH//2, start_y + i * int(SCREEN_HEIGHT * 0.05)))
                     
                     # Add glow effect for important text
-                    if self.glow_effect > 0:
-                        glow_surface = pygame.Surface((text.get_width() + 10, text.get_height() + 10), pygame.SRCALPHA)
-                        glow_color = (255, 255, 255, int(64 * (self.glow_effect / 30)))
-                        pygame.draw.rect(glow_surface, glow_color, glow_surface.get_rect(), border_radius=5)
+                    if glow > 0:
+                        glow_surface = self.glow_pool.get((text.get_width() + 10, text.get_height() + 10),
+                                                          WHITE, 64 * (glow / 30), radius=5)
                         self.screen.blit(glow_surface, (text_rect.x - 5, text_rect.y - 5))
                     
                     self.screen.blit(text, text_rect)
             
-            # Draw UI elements
-            if hasattr(self, 'spin_button'):
-                self.spin_button.draw(self.screen)
-            if hasattr(self, 'back_button'):
-                self.back_button.draw(self.screen)
-            if hasattr(self, 'info_button'):
-                self.info_button.draw(self.screen)
-            if hasattr(self, 'config_button'):
-                self.config_button.draw(self.screen)
-            
-            # Draw won prizes list
-            self.won_prizes_list.draw(self.screen)
+            # Draw won prizes list (Hintergrund ist im statischen Layer)
+            self.won_prizes_list.draw_content(self.screen)
             
             # Draw info box if visible
             if hasattr(self, 'info_box') and self.info_box.visible:
@@ -567,12 +690,133 @@ class SlotMachine(BaseGame):
             if hasattr(self, 'particle_system'):
                 self.particle_system.draw(self.screen)
             
-            # Update display
-            pygame.display.flip()
+            if self.show_stats:
+                self.draw_stats()
             
         except Exception as e:
             print(f"Error in draw(): {str(e)}")
 
+    @staticmethod
+    def slot_size_for(width, height):
+        """Reel size for a screen of width x height"""
+        return int(min(width * 0.15, height * 0.25))  # Responsive slot size
+
+    @classmethod
+    def reel_sprite_sizes(cls):
+        """Every size the reels draw symbols at (used by build_assets.py)"""
+        slot_size = cls.slot_size_for(SCREEN_WIDTH, SCREEN_HEIGHT)
+        return [(slot_size - 20, slot_size - 20)]
+
+    @classmethod
+    def asset_requests(cls):
+        """What init_resources() loads, for the AssetLoader to decode ahead of time"""
+        requests = []
+        for symbol in cls.SYMBOLS:
+            name = f'{symbol.lower()}.png'
+            requests.append(('sprite', name))
+            requests += [('prescaled', name, size) for size in cls.reel_sprite_sizes()]
+        requests += [('sound', 'sounds', file) for file in cls.SOUND_FILES.values()]
+        requests.append(('music', cls.MUSIC_FILE))
+        return requests
+
+    def reel_layout(self):
+        """Slot size and unshaken top-left position of each reel"""
+        slot_size = self.slot_size_for(SCREEN_WIDTH, SCREEN_HEIGHT)
+        slot_spacing = int(slot_size * 1.2)  # Space between slots
+        slot_y = SCREEN_HEIGHT//2 - slot_size//2
+        positions = [(SCREEN_WIDTH//2 - slot_spacing + 150 + (i-1)*slot_spacing, slot_y)
+                     for i in range(len(self.slots))]
+        return slot_size, positions
+
+    def build_reel_strips(self, slot_size):
+        """Composite the reel strips for `slot_size` if they are missing or stale"""
+        sprite_size = (slot_size - 20, slot_size - 20)
+        
+        def sprite_for(symbol):
+            name = self.SYMBOLS[symbol]
+            return self.sprite_cache.get(name, sprite_size) if name in self.sprites else None
+        
+        for strip in self.reel_strips:
+            if strip.cell_size != slot_size:
+                strip.build(slot_size, sprite_for)
+
+    def reel_positions(self):
+        """Reel positions for drawing, interpolated between the last two ticks"""
+        if not self.rolling:
+            return [strip.position for strip in self.reel_strips]
+        elapsed = self.roll_time + self.alpha / self.tick_rate
+        return [strip.position_at(elapsed) for strip in self.reel_strips]
+
+    def collect_dirty(self):
+        """Report everything that changed since the last frame to the renderer"""
+        renderer = self.renderer
+        
+        # Effekte, neue Challenge oder Overlay-Wechsel: alles neu zeichnen
+        glow, shake = self.effect_levels()
+        effects = glow > 0 or shake > 0
+        scene_state = (self.current_challenge, self.show_stats, effects)
+        if effects or scene_state != self._drawn_scene_state:
+            renderer.invalidate()
+        self._drawn_scene_state = scene_state
+        
+        # Walzen nur, wenn sich ihr Streifen-Offset geändert hat
+        slot_size, positions = self.reel_layout()
+        self.build_reel_strips(slot_size)
+        reel_state = [(slot_size, strip.offset(position))
+                      for strip, position in zip(self.reel_strips, self.reel_positions())]
+        drawn = self._drawn_reel_state or [None] * len(reel_state)
+        for (x, y), state, old in zip(positions, reel_state, drawn):
+            if state != old:
+                renderer.invalidate((x - 5, y - 5, slot_size + 10, slot_size + 10))
+        self._drawn_reel_state = reel_state
+        
+        # Partikel: alte und neue Position
+        bounds = self.particle_system.bounds()
+        for rect in (bounds, self._particle_bounds):
+            if rect:
+                renderer.invalidate(rect)
+        self._particle_bounds = bounds
+        
+        widgets = [self.back_button, self.info_button, self.spin_button, self.config_button,
+                   self.won_prizes_list, self.info_box, self.prize_config]
+        for widget in widgets:
+            for rect in widget.dirty_rects():
+                renderer.invalidate(rect)
+        
+        if self.show_stats:
+            renderer.invalidate((SCREEN_WIDTH // 2, 0, SCREEN_WIDTH // 2, 100))
+
+    def stats_lines(self):
+        """Debug lines for the F3 overlay"""
+        return [
+            AssetCache().stats_text(),
+            self.sprite_cache.stats_text(),
+            self.glow_pool.stats_text(),
+            FontManager.text_cache.stats_text(),
+            self.renderer.stats_text(),
+            self.scheduler.stats_text(),
+            self.timing_text()
+        ]
+
+    def timing_text(self):
+        """Last resize and re-entry time for the F3 overlay"""
+        parts = []
+        if self.resize_time is not None:
+            parts.append(f"Resize: {self.resize_time * 1000:.1f} ms")
+        if self.reentry_time is not None:
+            parts.append(f"Wiedereinstieg: {self.reentry_time * 1000:.1f} ms")
+        return ", ".join(parts) or "Resize: -"
+
+
+    def draw_stats(self):
+        """Draw the F3 debug overlay in the top right corner"""
+        font = self.font_manager.get_font('tiny')
+        y = 5
+        for line in self.stats_lines():
+            text = font.render(line, True, WHITE)
+            self.screen.blit(text, (SCREEN_WIDTH - text.get_width() - 5, y))
+            y += text.get_height() + 2
+
     def cleanup(self):
         """Clean up resources before closing completely"""
         try:
@@ -601,6 +845,7 @@ class SlotMachine(BaseGame):
             self.glow_effect = 0
             self.shake_offset = 0
             self.flash_effect = 0
+            self._previous_effects = (0, 0)
         except Exception as e:
             print(f"Error during cleanup: {e}")
 
@@ -608,12 +853,15 @@ class SlotMachine(BaseGame):
         """Main game loop using parent's implementation"""
         self.running = True
         result = None
+        self.renderer.invalidate()  # Bildschirm zeigt noch das Menü
         
         while self.running:
-            for event in pygame.event.get():
+            for event in self.next_events():
                 if event.type == pygame.QUIT:
                     self.cleanup()
                     return "quit"
+                if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                    self.renderer.invalidate()
                     
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
@@ -625,10 +873,10 @@ class SlotMachine(BaseGame):
                             self.cleanup_to_menu()
                             return "menu"
                             
+                # process_event() gibt True nur für "behandelt" zurück, Szenen sind Strings
                 result = self.process_event(event)
-                if result:
+                if isinstance(result, str):
                     return result
                     
             self.update()
-            self.draw()
-            pygame.time.wait(10)
+            self.present()
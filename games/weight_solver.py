@@ -0,0 +1,155 @@
+"""Find integer symbol weights that hit target win rates.
+
+Example: jackpot about once per 500 spins, any triple about 1 in 25 and
+doubles about 45%:
+
+    python main.py solve-weights --jackpot 500 --triple 25 --double 0.45
+
+The search enumerates integer weight vectors with a fixed total (100 by
+default) where Lugia (index 0) is strictly the rarest symbol. Rates only
+depend on the multiset of the other weights, so those are enumerated in
+non-increasing order. Per candidate the class sums of the outcome table
+reduce to power sums of the symbol probabilities (3 reels):
+
+    jackpot = p0^3,  triple = sum p^3,  double = 3 * (sum p^2 - sum p^3)
+
+The best candidates are then checked against the exact OutcomeTable.
+"""
+import heapq
+import math
+import sys
+import time
+
+from games.slot_engine import WEIGHTS, SYMBOLS, REELS, JACKPOT, MAIN, DOUBLE, outcome_table
+
+# Number of Lugia weights (closest to the jackpot target first) to search
+JACKPOT_CANDIDATES = 3
+
+
+def target_probability(value):
+    """Accept probabilities (0.45) or "1 in N spins" (500)"""
+    if value is None:
+        return None
+    value = float(value)
+    if value <= 0:
+        raise ValueError("Target rates must be positive")
+    return 1.0 / value if value > 1 else value
+
+
+def exact_rates(weights):
+    """Jackpot, triple (jackpot included) and double rate from the outcome table"""
+    table = outcome_table(weights)
+    return {
+        'jackpot': table.probability(JACKPOT),
+        'triple': table.probability(JACKPOT) + table.probability(MAIN),
+        'double': table.probability(DOUBLE)
+    }
+
+
+def _error(rates, targets):
+    """Sum of squared log ratios, so 1/250 vs 1/500 counts like 1/1000"""
+    return sum(math.log(rates[name] / target) ** 2
+               for name, target in targets.items() if rates[name] > 0)
+
+
+def _others(count, total, minimum, maximum):
+    """Non-increasing tuples of `count` weights in [minimum, maximum] summing to total"""
+    if count == 1:
+        if minimum <= total <= maximum:
+            yield (total,)
+        return
+    upper = min(maximum, total - minimum * (count - 1))
+    lower = -(-total // count)  # Größtes Element ist mindestens der Durchschnitt
+    for first in range(upper, max(lower, minimum) - 1, -1):
+        for rest in _others(count - 1, total - first, minimum, first):
+            yield (first,) + rest
+
+
+def solve(jackpot=None, triple=None, double=None, total=100, symbols=len(WEIGHTS), top=5):
+    """Return the `top` weight vectors closest to the targets
+
+    Targets accept probabilities or "1 in N" values (see
+    target_probability). Each candidate is a dict with `weights`, the
+    exact `rates` and the `error` score (0 = exact hit).
+    """
+    if REELS != 3:
+        raise ValueError("The closed-form search assumes 3 reels")
+    targets = {name: target_probability(value)
+               for name, value in (('jackpot', jackpot), ('triple', triple), ('double', double))
+               if value is not None}
+    if not targets:
+        raise ValueError("At least one target rate is required")
+
+    # Lugia muss seltener sein als jedes andere Symbol
+    lugia_weights = [w for w in range(1, total) if w + (symbols - 1) * (w + 1) <= total]
+    if 'jackpot' in targets:
+        lugia_weights.sort(key=lambda w: abs(math.log((w / total) ** 3 / targets['jackpot'])))
+        lugia_weights = lugia_weights[:JACKPOT_CANDIDATES]
+
+    best = []  # Heap mit (-error, weights)
+    cube = total ** 3
+    for w0 in lugia_weights:
+        for rest in _others(symbols - 1, total - w0, w0 + 1, total):
+            s2 = w0 * w0
+            s3 = w0 * w0 * w0
+            for w in rest:
+                s2 += w * w
+                s3 += w * w * w
+            rates = {
+                'jackpot': w0 * w0 * w0 / cube,
+                'triple': s3 / cube,
+                'double': 3 * (s2 * total - s3) / cube
+            }
+            error = _error(rates, targets)
+            entry = (-error, (w0,) + rest)
+            if len(best) < top:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+
+    candidates = []
+    for _, weights in sorted(best, reverse=True):
+        rates = exact_rates(weights)
+        candidates.append({
+            'weights': list(weights),
+            'rates': rates,
+            'error': _error(rates, targets)
+        })
+    return candidates
+
+
+def format_candidates(candidates, symbols=SYMBOLS):
+    """Human readable table of solve() results"""
+    header = "  ".join(f"{s[:9]:>9}" for s in symbols)
+    lines = [f"{header}   Jackpot      Triple    Double   Fehler"]
+    for c in candidates:
+        weights = "  ".join(f"{w:>9}" for w in c['weights'])
+        rates = c['rates']
+        lines.append(f"{weights}   1/{1 / rates['jackpot']:<9,.0f} 1/{1 / rates['triple']:<7.1f} "
+                     f"{rates['double']:>7.2%}   {c['error']:.4f}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Command line entry point, also used by `python main.py solve-weights`"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="main.py solve-weights",
+                                     description="Gewichtungen für Ziel-Gewinnchancen finden")
+    parser.add_argument('--jackpot', type=float, help="Jackpot-Chance, z.B. 500 (= 1 in 500) oder 0.002")
+    parser.add_argument('--triple', type=float, help="Chance auf 3 gleiche Symbole, z.B. 25")
+    parser.add_argument('--double', type=float, help="Chance auf 2 gleiche Symbole, z.B. 0.45")
+    parser.add_argument('--total', type=int, default=100, help="Summe der Gewichtungen")
+    parser.add_argument('--top', type=int, default=5, help="Anzahl Vorschläge")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    candidates = solve(args.jackpot, args.triple, args.double, args.total, top=args.top)
+    elapsed = time.perf_counter() - start
+    print(format_candidates(candidates))
+    print(f"Dauer: {elapsed * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,24 @@
+import argparse
 import pygame
 import sys
+import time
 from utils.font_manager import FontManager
 from utils.ui_elements import Button
+from utils.renderer import DirtyRectRenderer
+from utils.frame_scheduler import FrameScheduler
+from utils.scene_manager import SceneManager
+from utils.asset_cache import AssetCache
+from utils.asset_loader import AssetLoader
 from games.slot_machine import SlotMachine
 from games.constants import *
 
 class MainMenu:
-    def __init__(self, screen):
+    SLOT_TEXT = 'Arteus Slot Machine'
+    LOADING_COLOR = (90, 90, 110)
+    
+    def __init__(self, screen, loader=None):
         self.screen = screen
+        self.loader = loader  # Dekodiert die Assets der Slot Machine im Hintergrund
         self.font_manager = FontManager()
         self.title_font = self.font_manager.get_font('title')
         self.normal_font = self.font_manager.get_font('normal')
@@ -20,7 +31,7 @@ class MainMenu:
         self.buttons = {
             'slot': Button(
                 button_x, 250, button_width, button_height,
-                text='Arteus Slot Machine',
+                text=self.SLOT_TEXT,
                 color=BLUE,
                 hover_color=(100, 180, 255),
                 text_color=WHITE,
@@ -35,32 +46,74 @@ class MainMenu:
                 font=self.normal_font
             )
         }
+        self.renderer = DirtyRectRenderer(screen)
+        self.scheduler = FrameScheduler(FPS)  # Menü bewegt sich nie von selbst
+        
+        self.slot_ready = loader is None or loader.ready('slot')
+        if not self.slot_ready:
+            button = self.buttons['slot']
+            button.color = button.hover_color = self.LOADING_COLOR
+            self.update_loading()
+    
+    def update_loading(self):
+        """Show the loading progress of the slot machine on its button until it is ready"""
+        if self.slot_ready:
+            return
+        button = self.buttons['slot']
+        if self.loader.ready('slot'):
+            self.slot_ready = True
+            button.text = self.SLOT_TEXT
+            button.color, button.hover_color = BLUE, (100, 180, 255)
+            self.loader.mark("Slot Machine bereit")
+        else:
+            button.text = f"Lädt... {int(self.loader.progress('slot') * 100)}%"
     
     def draw(self, screen):
         # Draw background
         screen.fill(BLACK)
         
         # Draw title
-        title = self.title_font.render("Pokemon Card Slot", True, GOLD)
+        title = FontManager.render(self.title_font, "Pokemon Card Slot", GOLD)
         title_rect = title.get_rect(centerx=screen.get_width()//2, y=150)
         screen.blit(title, title_rect)
         
         # Draw buttons
         for button in self.buttons.values():
             button.draw(screen)
-        
-        pygame.display.flip()
+    
+    def present(self):
+        """Redraw only the buttons whose hover state changed"""
+        for button in self.buttons.values():
+            for rect in button.dirty_rects():
+                self.renderer.invalidate(rect)
+        self.renderer.render(lambda: self.draw(self.screen))
+        if self.loader is not None:
+            self.loader.mark("erstes Bild")
+    
+    def resume(self):
+        """Called by the SceneManager when the menu becomes active again"""
+        surface = pygame.display.get_surface()
+        if surface is not None and surface is not self.screen:
+            self.screen = surface
+            self.renderer.set_screen(surface)
     
     def run(self):
         running = True
+        self.renderer.invalidate()  # Bildschirm zeigt evtl. noch die Slot Machine
         while running:
-            for event in pygame.event.get():
+            self.update_loading()
+            # Während des Ladens weiterzeichnen, damit der Fortschritt sichtbar ist
+            for event in self.scheduler.events(animating=self.renderer.dirty or not self.slot_ready):
                 if event.type == pygame.QUIT:
                     return "quit"
+                if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                    self.renderer.invalidate()
                 
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:  # Left click
                         for name, button in self.buttons.items():
+                            if name == 'slot' and not self.slot_ready:
+                                continue
                             if button.handle_event(event):
                                 return name
                 
@@ -73,40 +126,49 @@ class MainMenu:
                     if event.key == pygame.K_ESCAPE:
                         return "quit"
             
-            self.draw(self.screen)
-            pygame.time.wait(10)
+            self.present()
 
-def main():
+def main(argv=None):
+    started_at = time.perf_counter()
+    argv = sys.argv[1:] if argv is None else argv
+    
+    # Kommandozeilen-Tools ohne Fenster
+    if argv and argv[0] == 'simulate':
+        from games.simulation import main as simulate_main
+        sys.exit(simulate_main(argv[1:]))
+    if argv and argv[0] == 'solve-weights':
+        from games.weight_solver import main as solver_main
+        sys.exit(solver_main(argv[1:]))
+    
+    parser = argparse.ArgumentParser(description="Pokemon Card Slot")
+    parser.add_argument('--seed', type=int, default=None, help="RNG Seed, um eine Session nachzuspielen")
+    parser.add_argument('--asset-report', action='store_true',
+                        help="Ladezeit und Größe jedes Assets beim Beenden ausgeben")
+    args = parser.parse_args(argv)
+    
     pygame.init()
+    # Sprites, Sounds und Musik der Slot Machine schon dekodieren, während das Menü erscheint
+    loader = AssetLoader(started_at)
+    loader.add('slot', SlotMachine.asset_requests())
+    
     pygame.display.set_caption("Pokemon Card Slot")
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     
-    menu = MainMenu(screen)
-    slot_machine = None
-    current_screen = "menu"
+    # Szenen bleiben nach dem ersten Aufruf geladen (Sprites, Sounds, Preisliste)
+    scenes = SceneManager()
+    scenes.register("menu", lambda: MainMenu(screen, loader))
+    scenes.register("slot", lambda: SlotMachine(screen, seed=args.seed))
     
     try:
-        # Main game loop
-        running = True
-        while running:
-            if current_screen == "menu":
-                current_screen = menu.run()
-            elif current_screen == "slot":
-                if slot_machine is None:
-                    slot_machine = SlotMachine(screen)
-                current_screen = slot_machine.run()
-                if current_screen != "slot":
-                    slot_machine = None
-            elif current_screen == "quit":
-                running = False
-            
-            # Small delay to prevent high CPU usage
-            pygame.time.wait(10)
+        scenes.run("menu")
     
     except Exception as e:
         print(f"Critical error: {e}")
     
     finally:
+        if args.asset_report:
+            print(AssetCache().report())
+            print(loader.stats_text())
         pygame.quit()
         sys.exit(0)
 
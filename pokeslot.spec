@@ -6,10 +6,10 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
+    # Nur das Asset-Bundle; vorher `python build_assets.py` ausführen.
+    # games/ und utils/ landen als Module im PYZ.
     datas=[
-        ('assets', 'assets'),
-        ('games', 'games'),
-        ('utils', 'utils'),
+        ('assets/build/assets.bundle', 'assets/build'),
     ],
     hiddenimports=['pygame'],
     hookspath=[],
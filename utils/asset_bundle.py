@@ -0,0 +1,143 @@
+"""Single-file asset bundle
+
+All files below assets/ (including the build outputs) packed into one
+file, so the frozen game opens and maps a single file instead of one per
+asset. Layout:
+
+    MAGIC (8 bytes) | index length (uint32, little endian) | index JSON | blobs
+
+The index maps paths below assets/ ('sprites/lugia.png') to
+[offset, length] relative to the start of the blob section; blobs are
+aligned to 16 bytes. AssetBundle maps the file with mmap and hands out
+memoryview slices, so looking up an asset does not copy it. The mapping
+is copy-on-write: a surface created on top of it may be drawn to without
+touching the file.
+
+Raw pixels can be used in place (pygame.image.frombuffer). PNGs, fonts
+and sounds have to go through pygame's file loaders; BundleFile gives
+them a file object over the slice, which copies only the chunks they
+read, never the whole file up front.
+"""
+import io
+import json
+import mmap
+import struct
+
+MAGIC = b'PKSLOT1\0'
+ALIGN = 16
+
+
+def _aligned(n):
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+def write_bundle(target, files):
+    """Write `files` ({path below assets/: file system path}) to `target`"""
+    index = {}
+    offset = 0
+    for name in sorted(files):
+        with open(files[name], 'rb') as f:
+            length = len(f.read())
+        index[name] = [offset, length]
+        offset = _aligned(offset + length)
+
+    header = json.dumps({'files': index}, sort_keys=True).encode('utf-8')
+    data_start = _aligned(len(MAGIC) + 4 + len(header))
+    with open(target, 'wb') as out:
+        out.write(MAGIC)
+        out.write(struct.pack('<I', len(header)))
+        out.write(header)
+        out.write(b'\0' * (data_start - out.tell()))
+        for name in sorted(files):
+            start, length = index[name]
+            out.write(b'\0' * (data_start + start - out.tell()))
+            with open(files[name], 'rb') as f:
+                out.write(f.read())
+    return data_start + offset
+
+
+class AssetBundle:
+    """Read-only, memory-mapped view of a bundle written by write_bundle()"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+        self._view = memoryview(self._mmap)
+
+        if bytes(self._view[:len(MAGIC)]) != MAGIC:
+            self.close()
+            raise ValueError(f"Not an asset bundle: {path}")
+        (header_length,) = struct.unpack_from('<I', self._mmap, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        header = json.loads(bytes(self._view[header_start:header_start + header_length]).decode('utf-8'))
+        self._data_start = _aligned(header_start + header_length)
+        self.index = header['files']
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def get(self, name):
+        """memoryview of the file `name` (path below assets/), None if missing"""
+        entry = self.index.get(name)
+        if entry is None:
+            return None
+        start = self._data_start + entry[0]
+        return self._view[start:start + entry[1]]
+
+    def size(self, name):
+        entry = self.index.get(name)
+        return entry[1] if entry else 0
+
+    def close(self):
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+
+class BundleFile(io.RawIOBase):
+    """Seekable, read-only file object over a memoryview
+
+    read() copies just the requested bytes out of the view, so a decoder
+    or the music stream reads the asset in chunks straight from the
+    mapping.
+    """
+
+    def __init__(self, view):
+        super().__init__()
+        self._view = view
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def read(self, size=-1):
+        end = len(self._view) if size is None or size < 0 else min(len(self._view), self._pos + size)
+        data = bytes(self._view[self._pos:end])
+        self._pos = max(self._pos, end)
+        return data
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._pos + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._pos = position
+        return position
+
+    def tell(self):
+        return self._pos
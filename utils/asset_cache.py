@@ -0,0 +1,399 @@
+import json
+import os
+import sys
+import threading
+import time
+
+import pygame
+
+from utils.asset_bundle import AssetBundle, BundleFile
+
+MUSIC_PREFETCH_CHUNK = 1024 * 1024
+
+
+def resolve_base_path():
+    """Project root in development, the unpacked bundle when frozen"""
+    if getattr(sys, 'frozen', False):
+        # Running as compiled executable
+        return sys._MEIPASS
+    # Running in development
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def use_bundle():
+    """Read assets from assets/build/assets.bundle instead of the loose files?
+
+    Always in the frozen game (it only ships the bundle); in development
+    only with POKESLOT_BUNDLE=1, so edited files show up without a rebuild.
+    """
+    return getattr(sys, 'frozen', False) or os.environ.get('POKESLOT_BUNDLE') == '1'
+
+
+class AssetCache:
+    """Shared loader for sprites, sounds and fonts
+
+    Every file is decoded once: further requests for the same path (and
+    font size) return the same object and raise its ref count. release()
+    drops the reference and frees the asset once nobody holds it. Load
+    time, file size and decoded size are kept per asset, see report().
+
+    Assets are addressed by their path below assets/ ('sounds/win.wav').
+    With the bundle from build_assets.py they are read from its memory
+    mapping, otherwise from the loose files.
+
+    Loading is split into decode (file to pixels or samples, safe off the
+    main thread) and finish (convert_alpha() and the like). AssetLoader
+    runs the decode part of jobs() in a background thread; the first
+    request on the main thread then only finishes the asset.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AssetCache, cls).__new__(cls)
+            cls._instance.initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if not self.initialized:
+            self.base_path = resolve_base_path()
+            self._entries = {}  # Schlüssel -> Eintrag mit Asset, Refs und Ladestatistik
+            self._keys = {}     # id(Asset) -> Schlüssel, für release()
+            self.hits = 0
+            self._atlas = None  # (Surface, Rects) aus assets/build, False wenn nicht gebaut
+            self._atlas_index = None
+            self._manifest = None
+            self._lock = threading.Lock()
+            self._decoded = {}   # Schlüssel -> (dekodiert, Dauer), vom Hintergrund-Thread
+            self._decoding = {}  # Schlüssel -> Event, solange der Hintergrund-Thread dekodiert
+            self.bundle = self._open_bundle()
+            self.initialized = True
+
+    def _open_bundle(self):
+        bundle_path = self.path('build', 'assets.bundle')
+        if not use_bundle() or not os.path.exists(bundle_path):
+            return None
+        try:
+            return AssetBundle(bundle_path)
+        except Exception as e:
+            print(f"Warning: Asset bundle unusable, loading single files: {e}")
+            return None
+
+    def path(self, *parts):
+        """Absolute path of a file below assets/"""
+        return os.path.join(self.base_path, 'assets', *parts)
+
+    def exists(self, *parts):
+        if self.bundle is not None and '/'.join(parts) in self.bundle:
+            return True
+        return os.path.exists(self.path(*parts))
+
+    def _read(self, name):
+        """Contents of `name` as a memoryview into the bundle, else the file path"""
+        if self.bundle is not None:
+            view = self.bundle.get(name)
+            if view is not None:
+                return view
+        return self.path(*name.split('/'))
+
+    @staticmethod
+    def _file(source):
+        """Something pygame's loaders accept: the path, or a file object over the bundle bytes
+
+        The file object reads from the mapping and copies only the chunks
+        pygame asks for, not the whole file.
+        """
+        return BundleFile(source) if isinstance(source, memoryview) else source
+
+    def _json(self, name):
+        """Parsed JSON file `name`, None if it does not exist"""
+        if not self.exists(*name.split('/')):
+            return None
+        source = self._read(name)
+        if isinstance(source, memoryview):
+            return json.loads(bytes(source).decode('utf-8'))
+        with open(source, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _load(self, key, name, decode, finish=None, sizes=None):
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry['refs'] += 1
+            self.hits += 1
+            return entry['asset']
+
+        source = self._read(name)
+        start = time.perf_counter()
+        predecoded = self._take_decoded(key)
+        if predecoded is None:
+            decoded, background_time = decode(source), 0.0
+        else:
+            decoded, background_time = predecoded
+        asset = finish(decoded) if finish is not None else decoded
+        load_time = time.perf_counter() - start
+        file_bytes, decoded_bytes = sizes if sizes is not None else self._sizes(asset, source)
+        self._entries[key] = {
+            'asset': asset,
+            'name': name,
+            'bundled': isinstance(source, memoryview),
+            'refs': 1,
+            'load_time': load_time,              # auf dem Haupt-Thread
+            'background_time': background_time,  # vorab im AssetLoader
+            'file_bytes': file_bytes,
+            'decoded_bytes': decoded_bytes
+        }
+        self._keys[id(asset)] = key
+        return asset
+
+    def _take_decoded(self, key):
+        """(decoded, seconds) from the background thread, None if it has not decoded `key`"""
+        with self._lock:
+            done = self._decoding.get(key)
+        if done is not None:
+            # Läuft gerade im Hintergrund, Abwarten ist schneller als neu dekodieren
+            done.wait()
+        with self._lock:
+            return self._decoded.pop(key, None)
+
+    def jobs(self, requests):
+        """Decode jobs for `requests` like ('sprite', 'lugia.png') or ('sound', 'sounds', 'win.wav')
+
+        Kinds: image, sprite, prescaled, sound, music, with the arguments
+        of the method of the same name. Requests for missing files or
+        assets that are already loaded are left out.
+        """
+        jobs = {}
+        for kind, *args in requests:
+            job = getattr(self, f'_{kind}_job')(*args)
+            if job is None:
+                continue
+            key, name = job[0], job[1]
+            if key in self._entries or key in jobs or not self.exists(*name.split('/')):
+                continue
+            jobs[key] = job
+        return list(jobs.values())
+
+    def decode(self, job):
+        """Run the decode part of `job` (any thread); the next load of its asset picks it up"""
+        key, name, decode = job[0], job[1], job[2]
+        with self._lock:
+            if key in self._entries or key in self._decoded or key in self._decoding:
+                return
+            done = self._decoding[key] = threading.Event()
+        try:
+            start = time.perf_counter()
+            decoded = decode(self._read(name))
+            with self._lock:
+                self._decoded[key] = (decoded, time.perf_counter() - start)
+        except Exception as e:
+            # Der Haupt-Thread versucht es beim Laden noch einmal und meldet den Fehler
+            print(f"Warning: Could not preload {name}: {e}")
+        finally:
+            with self._lock:
+                del self._decoding[key]
+            done.set()
+
+    @staticmethod
+    def _sizes(asset, source):
+        """File size and (estimated) decoded size in bytes"""
+        if isinstance(source, memoryview):
+            file_bytes = len(source)
+        else:
+            file_bytes = os.path.getsize(source) if os.path.exists(source) else 0
+        if isinstance(asset, pygame.Surface):
+            decoded = asset.get_width() * asset.get_height() * asset.get_bytesize()
+        elif isinstance(asset, pygame.mixer.Sound):
+            frequency, size, channels = pygame.mixer.get_init()
+            decoded = int(asset.get_length() * frequency) * channels * abs(size) // 8
+        else:
+            decoded = file_bytes
+        return file_bytes, decoded
+
+    def _image_job(self, *parts, alpha=True):
+        name = '/'.join(parts)
+
+        def finish(surface):
+            if pygame.display.get_surface() is None:
+                return surface
+            return surface.convert_alpha() if alpha else surface.convert()
+
+        return ('image', name, alpha), name, lambda source: pygame.image.load(self._file(source), name), finish
+
+    def image(self, *parts, alpha=True):
+        """Decoded image (converted for fast blits once a display exists)"""
+        return self._load(*self._image_job(*parts, alpha=alpha))
+
+    def _read_atlas_index(self):
+        """Contents of build/atlas.json, None if not built"""
+        if self._atlas_index is None:
+            self._atlas_index = False
+            try:
+                self._atlas_index = self._json('build/atlas.json') or False
+            except Exception as e:
+                print(f"Warning: Sprite atlas unusable, loading single files: {e}")
+        return self._atlas_index or None
+
+    def atlas(self):
+        """(surface, rects) of the sprite atlas from build_assets.py, None if not built"""
+        if self._atlas is None:
+            self._atlas = False
+            index = self._read_atlas_index()
+            if index is not None:
+                try:
+                    self._atlas = (self.image('build', index['image']), index['sprites'])
+                except Exception as e:
+                    print(f"Warning: Sprite atlas unusable, loading single files: {e}")
+        return self._atlas or None
+
+    def _sprite_job(self, name):
+        # Vorab dekodiert wird das Bild, aus dem sprite() ausschneidet
+        index = self._read_atlas_index()
+        if index is not None and name in index['sprites']:
+            return self._image_job('build', index['image'])
+        return self._image_job('sprites', name)
+
+    def sprite(self, name):
+        """Sprite `name` (path below assets/sprites/), cut from the atlas if it is built"""
+        atlas = self.atlas()
+        if atlas is not None and name in atlas[1]:
+            surface, rects = atlas
+            # Teilfläche teilt sich die Pixel mit dem Atlas, kostet also nichts extra
+            return self._load(('sprite', name), 'build/atlas.png',
+                              lambda source: surface.subsurface(rects[name]), sizes=(0, 0))
+        return self.image('sprites', name)
+
+    def manifest(self):
+        """Entries of assets/build/manifest.json ({} if nothing is built)"""
+        if self._manifest is None:
+            self._manifest = {}
+            try:
+                manifest = self._json('build/manifest.json')
+                if manifest is not None:
+                    self._manifest = manifest.get('assets', {})
+            except Exception as e:
+                print(f"Warning: Asset manifest unusable: {e}")
+        return self._manifest
+
+    def built(self, source, variant):
+        """Name of a build output for `source` (e.g. 'sounds/win.wav', 'ogg'), None if not built"""
+        output = self.manifest().get(source, {}).get('outputs', {}).get(variant)
+        if output is None:
+            return None
+        name = f'build/{output}'
+        return name if self.exists(*name.split('/')) else None
+
+    def _prescaled_job(self, name, size):
+        w, h = size
+        built = self.built(f'sprites/{name}', f'{w}x{h}')
+        if built is None:
+            return None
+
+        def decode(source):
+            if isinstance(source, memoryview):
+                # Pixel bleiben in der Speicherabbildung des Bundles, nichts wird kopiert
+                return pygame.image.frombuffer(source, (w, h), 'BGRA')
+            with open(source, 'rb') as f:
+                return pygame.image.frombuffer(f.read(), (w, h), 'BGRA')
+
+        def finish(surface):
+            display = pygame.display.get_surface()
+            if display is None:
+                return surface
+            if display.get_bitsize() == 32 and display.get_masks()[:3] == surface.get_masks()[:3]:
+                # Schon im Format von convert_alpha()
+                return surface
+            return surface.convert_alpha()
+
+        return ('prescaled', built), built, decode, finish
+
+    def prescaled(self, name, size):
+        """Sprite `name` pre-scaled to `size` by build_assets.py, None if not built"""
+        job = self._prescaled_job(name, size)
+        return self._load(*job) if job is not None else None
+
+    def _sound_job(self, *parts):
+        # Umgewandelte OGG-Datei aus dem Build bevorzugen
+        name = '/'.join(parts)
+        name = self.built(name, 'ogg') or name
+        return ('sound', name), name, lambda source: pygame.mixer.Sound(file=self._file(source))
+
+    def sound(self, *parts):
+        return self._load(*self._sound_job(*parts))
+
+    def _music_job(self, filename):
+        name = self.built(f'music/{filename}', 'ogg') or f'music/{filename}'
+
+        def prefetch(source):
+            # Musik wird gestreamt; vorab nur einmal lesen, damit sie im Dateicache liegt
+            if isinstance(source, memoryview):
+                for start in range(0, len(source), MUSIC_PREFETCH_CHUNK):
+                    bytes(source[start:start + MUSIC_PREFETCH_CHUNK])
+            else:
+                with open(source, 'rb') as f:
+                    while f.read(MUSIC_PREFETCH_CHUNK):
+                        pass
+            return True
+
+        return ('music', name), name, prefetch
+
+    def music_source(self, filename):
+        """(source, name) to stream `filename` from, for pygame.mixer.music.load(source, name)
+
+        The OGG build output if there is one. The source is a path or a
+        new file object over the mapped bundle bytes, which pygame streams
+        in chunks without copying the track; call this for every load.
+        """
+        key, name, _prefetch = self._music_job(filename)
+        self._take_decoded(key)
+        return self._file(self._read(name)), name
+
+    def font(self, size, *parts):
+        name = '/'.join(parts)
+        return self._load(('font', name, size), name,
+                          lambda source: pygame.font.Font(self._file(source), size))
+
+    def release(self, asset):
+        """Drop one reference; the asset is freed when none are left"""
+        key = self._keys.get(id(asset))
+        if key is None:
+            return
+        entry = self._entries[key]
+        entry['refs'] -= 1
+        if entry['refs'] <= 0:
+            del self._entries[key]
+            del self._keys[id(asset)]
+
+    def entries(self):
+        """Loaded assets as (key, entry), slowest first"""
+        items = list(self._entries.items())
+        items.sort(key=lambda item: item[1]['load_time'], reverse=True)
+        return items
+
+    def report(self):
+        """Per-asset load time and sizes, plus a total line"""
+        lines = []
+        for key, entry in self.entries():
+            kind = key[0]
+            name = entry['name']
+            if kind == 'font':
+                name += f" ({key[2]} pt)"
+            elif kind == 'sprite':
+                name += f" #{key[1]}"
+            if entry['bundled']:
+                name += " [bundle]"
+            if entry['background_time']:
+                name += f" (+{entry['background_time'] * 1000:.1f} ms im Hintergrund)"
+            lines.append(f"{entry['load_time'] * 1000:7.1f} ms  {entry['file_bytes'] / 1024:8.1f} KB Datei  "
+                         f"{entry['decoded_bytes'] / 1024:8.1f} KB dekodiert  x{entry['refs']}  {kind:<5} {name}")
+        lines.append(self.stats_text())
+        return '\n'.join(lines)
+
+    def stats_text(self):
+        entries = self._entries.values()
+        load_time = sum(e['load_time'] for e in entries)
+        background_time = sum(e['background_time'] for e in entries)
+        decoded = sum(e['decoded_bytes'] for e in entries)
+        source = "Bundle" if self.bundle is not None else "Dateien"
+        return (f"Assets ({source}): {len(self._entries)} geladen in {load_time * 1000:.0f} ms "
+                f"(+{background_time * 1000:.0f} ms im Hintergrund), "
+                f"{decoded / 1024:.0f} KB, {self.hits} wiederverwendet")
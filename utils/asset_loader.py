@@ -0,0 +1,78 @@
+import queue
+import threading
+import time
+
+from utils.asset_cache import AssetCache
+
+
+class AssetLoader:
+    """Decodes assets in a background thread before a scene needs them
+
+    add() queues a named group of AssetCache requests (see
+    AssetCache.jobs()). One worker thread decodes the groups in order;
+    a group is ready once all its jobs are done, failed ones included, so
+    the scene can always be entered and loads what is missing itself.
+    Startup times (first frame, scene ready) are measured from
+    `started_at` with mark().
+    """
+
+    def __init__(self, started_at=None):
+        self.assets = AssetCache()
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self._groups = {}  # Name -> {'total', 'done', 'ready' (Event), 'ready_at'}
+        self.milestones = {}  # Name -> Sekunden seit started_at
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="AssetLoader", daemon=True)
+        self._thread.start()
+
+    def add(self, group, requests):
+        """Queue `requests` for decoding as `group`"""
+        jobs = self.assets.jobs(requests)
+        self._groups[group] = {'total': len(jobs), 'done': 0, 'ready': threading.Event(), 'ready_at': None}
+        self._queue.put((group, jobs))
+
+    def _run(self):
+        while True:
+            group, jobs = self._queue.get()
+            state = self._groups[group]
+            for job in jobs:
+                self.assets.decode(job)
+                state['done'] += 1
+            state['ready_at'] = time.perf_counter()
+            state['ready'].set()
+
+    def ready(self, group):
+        """True once all assets of `group` are decoded (or the group is unknown)"""
+        state = self._groups.get(group)
+        return state is None or state['ready'].is_set()
+
+    def progress(self, group):
+        """Share of `group` decoded so far, 0.0 to 1.0"""
+        state = self._groups.get(group)
+        if state is None or state['total'] == 0:
+            return 1.0
+        return state['done'] / state['total']
+
+    def wait(self, group, timeout=None):
+        state = self._groups.get(group)
+        return state is None or state['ready'].wait(timeout)
+
+    def ready_time(self, group):
+        """Seconds from started_at until `group` was ready, None while loading"""
+        state = self._groups.get(group)
+        if state is None or state['ready_at'] is None:
+            return None
+        return state['ready_at'] - self.started_at
+
+    def since_start(self):
+        return time.perf_counter() - self.started_at
+
+    def mark(self, milestone):
+        """Record the time from started_at to `milestone` (first call only) and print it"""
+        if milestone not in self.milestones:
+            self.milestones[milestone] = self.since_start()
+            print(f"Start: {milestone} nach {self.milestones[milestone] * 1000:.0f} ms")
+
+    def stats_text(self):
+        marks = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.milestones.items())
+        return f"Start: {marks or 'noch nichts angezeigt'}"
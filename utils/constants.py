@@ -60,16 +60,28 @@ FONT_FILES = {
 }
 
 # Animation settings
-PARTICLE_MAX = 100
+PARTICLE_MAX = 5000
 PARTICLE_LIFETIME = 1.0
 PARTICLE_SIZE = 3
+JACKPOT_FIREWORK_BURSTS = 6
+JACKPOT_FIREWORK_PARTICLES = 400
 TRANSITION_SPEED = 10
 
+# Fixed-timestep logic: feste Logik-Ticks, gezeichnet wird interpoliert
+LOGIC_HZ = 120
+MAX_FRAME_TIME = 0.25  # Nach Hängern höchstens so viel Zeit nachholen (s)
+# Abklingen der Gewinneffekte pro Sekunde (entspricht den alten Werten pro Frame bei 60 FPS)
+GLOW_DECAY = 60
+SHAKE_DECAY = 30
+FLASH_DECAY = 60
+JACKPOT_ANIMATION_DECAY = 120
+
 # Game specific settings
 SLOT_SYMBOLS = ['Charizard', 'Lugia', 'Tyranitar', 'Gengar', 'Oshawott', 'Arcanine']
 SLOT_WEIGHTS = [15, 5, 20, 20, 20, 20]  # Corresponding weights for symbols
 ROLL_DURATION = 2.5    # Total time for slots to stop
 ROLL_STAGGER = 0.5    # Time between each slot stopping
+REEL_SPIN_SPEED = 24  # Walzengeschwindigkeit beim Start (Symbole pro Sekunde)
 
 # Pokemon TCG Sets
 BOOSTER_SETS = [
@@ -1,10 +1,12 @@
 import pygame
-import os
-import sys
+from utils.render_cache import TextRenderCache
+from utils.asset_cache import AssetCache
 
 class FontManager:
     _instance = None
     initialized = False
+    # Gemeinsamer Cache für alle gerenderten Texte
+    text_cache = TextRenderCache(maxsize=512)
     
     @classmethod
     def get_instance(cls):
@@ -47,25 +49,19 @@ class FontManager:
     def initialize(self):
         """Load Pokemon font in all sizes"""
         try:
-            # Get the base path for assets
-            if getattr(sys, 'frozen', False):
-                # Running as compiled executable
-                base_path = sys._MEIPASS
-            else:
-                # Running in development
-                base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            
-            font_path = os.path.join(base_path, 'assets', 'fonts', 'PocketMonk-15ze.ttf')
+            assets = AssetCache()
+            font_file = ('fonts', 'PocketMonk-15ze.ttf')
             
-            if os.path.exists(font_path):
+            if assets.exists(*font_file):
+                # Jede Größe wird nur einmal geladen, auch über mehrere FontManager
                 pokemon_fonts = {
-                    size_name: pygame.font.Font(font_path, size)
+                    size_name: assets.font(size, *font_file)
                     for size_name, size in self.font_sizes.items()
                 }
                 self.fonts.update(pokemon_fonts)
                 print("Pokemon font loaded successfully")
             else:
-                print(f"Pokemon font file not found at: {font_path}")
+                print(f"Pokemon font file not found at: {assets.path(*font_file)}")
         except Exception as e:
             print(f"Error loading Pokemon font: {e}")
     
@@ -73,8 +69,17 @@ class FontManager:
         """Get font of specified size"""
         return self.fonts.get(size_name, self.fonts['normal'])
 
+    @classmethod
+    def render(cls, font, text, color, antialias=True):
+        """font.render() through the shared LRU text cache"""
+        return cls.text_cache.render(font, text, color, antialias)
+
     def cleanup(self):
         """Cleanup font resources"""
+        assets = AssetCache()
+        for font in self.fonts.values():
+            assets.release(font)
         self.fonts.clear()
+        FontManager.text_cache.clear()
         self.initialized = False
         FontManager._instance = None
@@ -0,0 +1,40 @@
+import pygame
+
+# Wie lange ein untätiger Loop höchstens auf ein Event wartet (ms)
+IDLE_TIMEOUT = 1000
+
+
+class FrameScheduler:
+    """Paces a game loop: capped frame rate while animating, blocking when idle
+
+    While something moves, events() ticks the clock so the loop runs at
+    most `fps` frames per second. When nothing moves it blocks in
+    pygame.event.wait() until input arrives (or `idle_timeout` ms pass),
+    so an idle scene uses no CPU instead of polling.
+    """
+
+    def __init__(self, fps=60, idle_timeout=IDLE_TIMEOUT, clock=None):
+        self.fps = fps
+        self.idle_timeout = idle_timeout
+        self.clock = clock or pygame.time.Clock()
+        self.active_frames = 0
+        self.idle_waits = 0
+
+    def events(self, animating=True):
+        """Wait for the next frame and return its events"""
+        if animating:
+            self.active_frames += 1
+            self.clock.tick(self.fps)
+            return pygame.event.get()
+
+        self.idle_waits += 1
+        event = pygame.event.wait(self.idle_timeout)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        # Die Wartezeit soll nicht als Frame-Zeit in den nächsten tick() eingehen
+        self.clock.tick()
+        return events
+
+    def stats_text(self):
+        return (f"Loop: {self.active_frames} Frames aktiv / {self.idle_waits} im Leerlauf, "
+                f"{self.clock.get_fps():.0f} FPS")
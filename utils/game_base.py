@@ -2,6 +2,9 @@ import pygame
 import time
 from utils.font_manager import FontManager
 from utils.sound_manager import SoundManager
+from utils.renderer import DirtyRectRenderer
+from utils.frame_scheduler import FrameScheduler
+from utils.constants import LOGIC_HZ, MAX_FRAME_TIME, SCREEN_WIDTH, SCREEN_HEIGHT
 
 class BaseGame:
     def __init__(self, screen):
@@ -10,14 +13,82 @@ class BaseGame:
         self.clock = pygame.time.Clock()
         self.FPS = 60
         self.last_update = pygame.time.get_ticks()
+        # Logik läuft in festen Ticks, unabhängig von der Bildrate
+        self.tick_rate = LOGIC_HZ
+        self.accumulator = 0.0
+        self.alpha = 0.0  # Bereits vergangener Anteil des nächsten Ticks, fürs Zeichnen
+        self.ticks = 0
         
         # Initialize managers
         self.font_manager = FontManager()
         self.sound_manager = SoundManager()
         
+        # Only changed screen regions are redrawn and presented
+        self.renderer = DirtyRectRenderer(screen)
+        # Begrenzt auf FPS während Animationen, blockiert im Leerlauf
+        self.scheduler = FrameScheduler(self.FPS, clock=self.clock)
+        
+        self.is_fullscreen = False
+        self.resize_time = None   # Dauer des letzten on_resize() (s)
+        self.reentry_time = None  # Von resume() bis zum ersten gezeigten Frame (s)
+        self._resumed_at = None
+        
+    def init_display(self):
+        """Switch the display to fullscreen or window according to is_fullscreen"""
+        if self.is_fullscreen:
+            # SCALED behält die logische Auflösung, das Layout bleibt gleich
+            try:
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT),
+                                                      pygame.FULLSCREEN | pygame.SCALED)
+            except pygame.error:
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.on_resize()
+    
+    def on_resize(self):
+        """Rebuild what depends on the screen size; override in child classes"""
+        self.renderer.set_screen(self.screen)
+    
+    def suspend(self):
+        """Called by the SceneManager when another scene takes over"""
+        pass
+    
+    def resume(self):
+        """Called by the SceneManager before run() when the scene becomes active
+
+        Scenes stay resident between visits, so this only picks up the
+        current display surface and resets the frame timing.
+        """
+        self._resumed_at = time.perf_counter()
+        surface = pygame.display.get_surface()
+        if surface is not None and surface is not self.screen:
+            self.screen = surface
+            self.on_resize()
+        self.renderer.invalidate()
+        # Die Zeit im Menü zählt nicht als Spielzeit
+        self.last_update = pygame.time.get_ticks()
+        self.accumulator = 0.0
+        
+    def is_animating(self):
+        """True while something moves without input; override in child classes
+
+        The default keeps the loop running at FPS.
+        """
+        return True
+    
+    def next_events(self):
+        """Events for the next frame, paced by self.scheduler"""
+        animating = self.is_animating()
+        events = self.scheduler.events(animating)
+        if not animating:
+            # Nach dem Warten keinen Zeitsprung in update() erzeugen
+            self.last_update = pygame.time.get_ticks()
+        return events
+        
     def handle_events(self):
         """Handle all pygame events"""
-        for event in pygame.event.get():
+        for event in self.next_events():
             if event.type == pygame.QUIT:
                 self.cleanup()
                 self.running = False
@@ -28,16 +99,55 @@ class BaseGame:
         pass
     
     def update(self):
-        """Override this method in child classes"""
-        # Calculate delta time for smooth animations
+        """Advance the game logic by the real time since the last frame"""
         current_time = pygame.time.get_ticks()
         self.dt = (current_time - self.last_update) / 1000.0  # Convert to seconds
         self.last_update = current_time
+        # Nach Hängern nicht hunderte Ticks auf einmal nachholen
+        self.advance(min(self.dt, MAX_FRAME_TIME))
+    
+    def advance(self, seconds):
+        """Run as many fixed logic ticks as fit into `seconds`
+
+        The remainder carries over to the next call and self.alpha tells
+        draw() how far the next tick has progressed. Not bound to real
+        time, so tests can run the logic faster than real time.
+        """
+        step = 1.0 / self.tick_rate
+        self.accumulator += seconds
+        # Kleine Toleranz, damit z.B. 0.5 s nicht an Rundungsfehlern einen Tick verlieren
+        while self.accumulator >= step - 1e-9:
+            self.tick(step)
+            self.accumulator = max(0.0, self.accumulator - step)
+            self.ticks += 1
+        self.alpha = self.accumulator / step
+    
+    def tick(self, dt):
+        """One fixed logic step of dt seconds; override in child classes"""
+        pass
+    
+    def interpolate(self, previous, current):
+        """Value between the last two ticks for the current frame"""
+        return previous + (current - previous) * self.alpha
     
     def draw(self):
-        """Override this method in child classes"""
+        """Override this method in child classes (draw only, no flip)"""
         pass
     
+    def collect_dirty(self):
+        """Report changed regions to self.renderer; override in child classes
+
+        The default redraws the whole screen every frame.
+        """
+        self.renderer.invalidate()
+    
+    def present(self):
+        """Redraw the dirty regions and push them to the display"""
+        self.collect_dirty()
+        if self.renderer.render(self.draw) and self._resumed_at is not None:
+            self.reentry_time = time.perf_counter() - self._resumed_at
+            self._resumed_at = None
+    
     def cleanup(self):
         """Clean up resources before exiting"""
         try:
@@ -80,9 +190,7 @@ class BaseGame:
                 break
                 
             self.update()
-            self.draw()
-            pygame.display.flip()
-            self.clock.tick(self.FPS)
+            self.present()
         
         self.cleanup()
         return result
@@ -0,0 +1,85 @@
+import pygame
+
+
+def ease_out_cubic(u):
+    """Fast start, smooth stop"""
+    return 1 - (1 - u) ** 3
+
+
+class ReelStrip:
+    """One reel drawn from a pre-composited strip of its symbols
+
+    The symbols in `order` are rendered once, top to bottom, into a surface
+    one cell wide and len(order) + 1 cells high. The extra cell repeats the
+    first symbol, so every reel position is a single clipped blit.
+
+    `position` is the strip cell at the top of the window, in cells. While
+    spinning it decreases (the symbols move down like on a real machine)
+    and eases out onto the cell of the predetermined result.
+    """
+
+    def __init__(self, order, symbol=None):
+        self.order = list(order)
+        self.position = float(self.order.index(symbol)) if symbol in self.order else 0.0
+        self.surface = None
+        self.cell_size = None
+        self._start = self.position
+        self._travel = 0.0
+        self._duration = 0.0
+
+    def build(self, cell_size, sprite_for):
+        """Composite the strip for `cell_size`; sprite_for(symbol) returns a Surface or None"""
+        n = len(self.order)
+        self.surface = pygame.Surface((cell_size, cell_size * (n + 1)), pygame.SRCALPHA)
+        for cell, symbol in enumerate(self.order + self.order[:1]):
+            sprite = sprite_for(symbol)
+            if sprite is None:
+                continue
+            rect = sprite.get_rect(center=(cell_size // 2, cell * cell_size + cell_size // 2))
+            # MAX auf die leere Fläche kopiert die Pixel 1:1, ohne Alpha-Verrechnung
+            self.surface.blit(sprite, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        self.cell_size = cell_size
+
+    def invalidate(self):
+        """Drop the composited surface (sprites or size changed)"""
+        self.surface = None
+        self.cell_size = None
+
+    def spin_to(self, symbol, duration, speed):
+        """Start spinning so the reel stops on `symbol` after `duration` seconds
+
+        `speed` is the speed at spin start in cells per second; the number
+        of full turns is chosen to match it.
+        """
+        n = len(self.order)
+        target = self.order.index(symbol)
+        # Ease-out cubic startet mit 3 * Strecke / Dauer
+        laps = max(1, round(speed * duration / 3 / n))
+        self._start = self.position
+        self._travel = laps * n + (self.position - target) % n
+        self._duration = duration
+
+    def position_at(self, elapsed):
+        """Reel position `elapsed` seconds after spin_to()"""
+        if self._duration <= 0 or elapsed >= self._duration:
+            u = 1.0
+        else:
+            u = max(0.0, elapsed / self._duration)
+        return (self._start - self._travel * ease_out_cubic(u)) % len(self.order)
+
+    def symbol_at(self, position):
+        """Symbol filling most of the window at `position`"""
+        return self.order[int(position + 0.5) % len(self.order)]
+
+    def offset(self, position):
+        """Pixel offset into the strip for `position`"""
+        return int(position * self.cell_size + 0.5) % (len(self.order) * self.cell_size)
+
+    def blit_args(self, x, y, position):
+        """(source, dest, area) for Surface.blits(), to batch several reels"""
+        size = self.cell_size
+        return self.surface, (x, y), (0, self.offset(position), size, size)
+
+    def draw(self, surface, x, y, position):
+        """Blit the window of the strip at `position` to (x, y)"""
+        surface.blit(*self.blit_args(x, y, position))
@@ -0,0 +1,128 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class ScaledSpriteCache:
+    """Scaled copies of sprites, keyed by (symbol, size)
+
+    Scaling happens once per symbol and size; afterwards draw() only looks
+    the surface up. Call invalidate() when the sizes change (resize,
+    fullscreen toggle). `hits` and `misses` show whether anything is still
+    scaled per frame. `prescaled(symbol, size)` may return a ready-made
+    surface (see build_assets.py) so nothing is scaled at runtime.
+    """
+
+    def __init__(self, sprites, prescaled=None):
+        self.sprites = sprites
+        self.prescaled = prescaled
+        self._scaled = {}
+        self.hits = 0
+        self.misses = 0
+        self.loaded = 0  # Vorskaliert aus assets/build übernommen
+
+    def get(self, symbol, size):
+        """Sprite `symbol` scaled to `size` (width, height)"""
+        key = (symbol, size)
+        surface = self._scaled.get(key)
+        if surface is None:
+            surface = self.prescaled(symbol, size) if self.prescaled else None
+            if surface is not None:
+                self.loaded += 1
+            else:
+                self.misses += 1
+                surface = pygame.transform.scale(self.sprites[symbol], size)
+            self._scaled[key] = surface
+        else:
+            self.hits += 1
+        return surface
+
+    def invalidate(self):
+        """Drop all scaled copies"""
+        self._scaled.clear()
+
+    def stats_text(self):
+        return (f"Sprites: {self.hits} Treffer / {self.misses} skaliert / {self.loaded} vorskaliert "
+                f"({len(self._scaled)} im Cache)")
+
+
+class TextRenderCache:
+    """Size-bounded LRU cache of rendered text surfaces
+
+    Keyed by (font, text, color, antialias). The returned surfaces are
+    shared, callers must only blit them.
+    """
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats_text(self):
+        return f"Text: {self.hit_rate:.1%} Treffer ({len(self._surfaces)}/{self.maxsize} im Cache)"
+
+
+class GlowPool:
+    """Pre-rendered glow rectangles for win effects
+
+    A glow is a filled, rounded SRCALPHA rectangle whose alpha fades with
+    the effect. Instead of allocating one per frame, get() quantizes the
+    alpha to `steps` levels and keeps each (size, color, radius, step)
+    surface in a bounded LRU pool, so a running win animation only looks
+    surfaces up once every step has been seen.
+    """
+
+    def __init__(self, steps=32, maxsize=256):
+        self.steps = steps
+        self.maxsize = maxsize
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, size, color, alpha, radius=0):
+        """Glow surface of `size` (width, height) in `color` with about `alpha`"""
+        step = round(max(0, min(255, alpha)) * self.steps / 255)
+        key = (tuple(size), tuple(color[:3]), radius, step)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = pygame.Surface(key[0], pygame.SRCALPHA)
+        pygame.draw.rect(surface, (*key[1], round(step * 255 / self.steps)), surface.get_rect(), border_radius=radius)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def stats_text(self):
+        return f"Glow: {self.hits} Treffer / {self.misses} erzeugt ({len(self._surfaces)}/{self.maxsize} im Pool)"
@@ -0,0 +1,69 @@
+import pygame
+
+
+class DirtyRectRenderer:
+    """Redraws and presents only the screen regions that changed
+
+    Scenes report changed regions with invalidate(rect) (or invalidate()
+    for the whole screen) and then call render(draw). If nothing is dirty
+    the frame is skipped entirely; otherwise draw() runs with the screen
+    clipped to the dirty area and only those rects are pushed with
+    pygame.display.update().
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self._rects = []
+        self._full = True
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+        self.last_coverage = 0.0  # Anteil der Bildschirmfläche im letzten Frame
+
+    def invalidate(self, rect=None):
+        """Mark `rect` dirty, or the whole screen if rect is None"""
+        if rect is None:
+            self._full = True
+        else:
+            self._rects.append(pygame.Rect(rect))
+
+    def set_screen(self, screen):
+        """Use a new display surface (after set_mode) and redraw everything"""
+        self.screen = screen
+        self.invalidate()
+
+    @property
+    def dirty(self):
+        return self._full or bool(self._rects)
+
+    def render(self, draw):
+        """Run draw() for the dirty area and present it, returns False if skipped"""
+        if not self.dirty:
+            self.frames_skipped += 1
+            return False
+
+        screen_rect = self.screen.get_rect()
+        if self._full:
+            draw()
+            pygame.display.flip()
+            self.last_coverage = 1.0
+        else:
+            rects = [r.clip(screen_rect) for r in self._rects]
+            rects = [r for r in rects if r.width and r.height]
+            if rects:
+                self.screen.set_clip(rects[0].unionall(rects[1:]))
+                try:
+                    draw()
+                finally:
+                    self.screen.set_clip(None)
+                pygame.display.update(rects)
+            area = screen_rect.width * screen_rect.height
+            self.last_coverage = min(1.0, sum(r.width * r.height for r in rects) / area)
+
+        self._rects = []
+        self._full = False
+        self.frames_drawn += 1
+        return True
+
+    def stats_text(self):
+        return (f"Frames: {self.frames_drawn} gezeichnet / {self.frames_skipped} übersprungen, "
+                f"zuletzt {self.last_coverage:.0%} der Fläche")
@@ -0,0 +1,53 @@
+import time
+
+
+class SceneManager:
+    """Keeps scenes resident and switches between them
+
+    Scenes are registered with a factory and built on first use. After
+    that they stay alive with their loaded assets; switching only calls
+    suspend() on the old and resume() on the new scene (if they have
+    these hooks) before running it. A scene's run() returns the name of
+    the next scene, or "quit"; anything else raises ValueError.
+    """
+
+    def __init__(self):
+        self._factories = {}
+        self.scenes = {}
+        self.current = None
+        self.build_times = {}  # Name -> Aufbauzeit beim ersten Besuch (s)
+
+    def register(self, name, factory):
+        """Register `factory` (no arguments) for the scene `name`"""
+        self._factories[name] = factory
+
+    def get(self, name):
+        """The resident scene `name`, built on first use"""
+        scene = self.scenes.get(name)
+        if scene is None:
+            start = time.perf_counter()
+            scene = self._factories[name]()
+            self.build_times[name] = time.perf_counter() - start
+            self.scenes[name] = scene
+        return scene
+
+    def switch(self, name):
+        """Suspend the current scene and resume `name`, returns the scene"""
+        if self.current is not None and self.current != name:
+            previous = self.scenes[self.current]
+            if hasattr(previous, 'suspend'):
+                previous.suspend()
+        scene = self.get(name)
+        if hasattr(scene, 'resume'):
+            scene.resume()
+        self.current = name
+        return scene
+
+    def run(self, start):
+        """Run scenes until one returns "quit"; any other unknown result is an error"""
+        name = start
+        while name != "quit":
+            if name not in self._factories:
+                raise ValueError(f"Unknown scene {name!r} (from {self.current!r})")
+            name = self.switch(name).run()
+        return name
@@ -1,6 +1,5 @@
 import pygame
-import os
-import sys
+from utils.asset_cache import AssetCache
 
 class SoundManager:
     _instance = None
@@ -24,20 +23,14 @@ class SoundManager:
     def load_sound(self, name, filename):
         """Load a sound file with error handling"""
         try:
-            # Get the base path for assets
-            if getattr(sys, 'frozen', False):
-                # Running as compiled executable
-                base_path = sys._MEIPASS
-            else:
-                # Running in development
-                base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            
-            sound_path = os.path.join(base_path, 'assets', 'sounds', filename)
-            if not os.path.exists(sound_path):
-                print(f"Warning: Sound file not found: {sound_path}")
+            assets = AssetCache()
+            if not assets.exists('sounds', filename):
+                print(f"Warning: Sound file not found: {assets.path('sounds', filename)}")
                 return False
+            if name in self.sounds:
+                assets.release(self.sounds[name])
             
-            sound = pygame.mixer.Sound(sound_path)
+            sound = assets.sound('sounds', filename)
             sound.set_volume(self.sound_volume)
             self.sounds[name] = sound
             return True
@@ -81,22 +74,15 @@ class SoundManager:
     def load_music(self, name, filename):
         """Load background music file"""
         try:
-            # Get the base path for assets
-            if getattr(sys, 'frozen', False):
-                # Running as compiled executable
-                base_path = sys._MEIPASS
-            else:
-                # Running in development
-                base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            
-            music_path = os.path.join(base_path, 'assets', 'music', filename)
-            if not os.path.exists(music_path):
-                print(f"Warning: Music file not found: {music_path}")
+            # Musik wird gestreamt, die Quelle kommt bei jedem Laden neu aus dem Asset-Cache
+            assets = AssetCache()
+            if not assets.exists('music', filename):
+                print(f"Warning: Music file not found: {assets.path('music', filename)}")
                 return False
             
-            pygame.mixer.music.load(music_path)
+            pygame.mixer.music.load(*assets.music_source(filename))
             pygame.mixer.music.set_volume(self.music_volume)
-            self.music_tracks[name] = music_path
+            self.music_tracks[name] = filename
             return True
         except Exception as e:
             print(f"Error loading music: {e}")
@@ -110,7 +96,7 @@ class SoundManager:
                     pygame.mixer.music.load(self.music)
                     pygame.mixer.music.play(loops)
             elif name in self.music_tracks:
-                pygame.mixer.music.load(self.music_tracks[name])
+                pygame.mixer.music.load(*AssetCache().music_source(self.music_tracks[name]))
                 pygame.mixer.music.play(loops)
         except Exception as e:
             print(f"Error playing music: {e}")
@@ -135,6 +121,9 @@ class SoundManager:
         try:
             self.stop_music()
             self.stop_all_sounds()
+            assets = AssetCache()
+            for sound in self.sounds.values():
+                assets.release(sound)
             self.sounds.clear()
             self.music_tracks.clear()
         except Exception as e:
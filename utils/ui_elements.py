@@ -2,9 +2,11 @@ from pygame.locals import *
 import pygame
 import sys
 import math
+from array import array
 from utils.constants import *
 from utils.font_manager import FontManager
 from games.prizes import JACKPOT_PRIZE, MAIN_PRIZES, DOUBLE_PRIZES, EASY_PRIZES
+from games.slot_engine import SYMBOLS, WEIGHTS, JACKPOT, MAIN, DOUBLE, OddsPreview
 
 class Button:
     def __init__(self, x, y, width, height, text='', color=(170, 170, 170), hover_color=(200, 200, 200), text_color=(255, 255, 255), font=None):
@@ -15,6 +17,15 @@ class Button:
         self.text_color = text_color
         self.font = font
         self.is_hovered = False
+        self._drawn_state = None
+        
+    def dirty_rects(self):
+        """Rects that changed since the last call (for DirtyRectRenderer)"""
+        state = (self.is_hovered, self.text, self.color, self.rect.topleft)
+        if state == self._drawn_state:
+            return []
+        self._drawn_state = state
+        return [self.rect]
         
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
@@ -32,7 +43,7 @@ class Button:
         
         if self.text != '':
             if self.font:
-                text_surface = self.font.render(self.text, True, self.text_color)
+                text_surface = FontManager.render(self.font, self.text, self.text_color)
                 text_rect = text_surface.get_rect(center=self.rect.center)
                 screen.blit(text_surface, text_rect)
 
@@ -45,65 +56,123 @@ class TextDisplay:
         self.font = self.font_manager.get_font(size)
         
     def draw(self, screen):
-        text_surface = self.font.render(self.text, True, self.color)
+        text_surface = FontManager.render(self.font, self.text, self.color)
         screen.blit(text_surface, self.pos)
         
     def update_text(self, new_text):
         self.text = new_text
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles = []
-        self.max_particles = 100  # Prevent excessive particles
-    
+    """Particles stored as parallel arrays (struct of arrays)
+
+    Positions, velocities and lifetimes live in flat `array` columns.
+    update() changes them in place in one pass, without allocating new
+    arrays or a dict per particle, and swap-removes expired particles in
+    O(1) on the way. The sprites are pre-rendered per (color, size, alpha
+    step) and all particles are drawn with one Surface.blits() call.
+    NumPy would work as well, but it is excluded from the frozen build
+    (pokeslot.spec).
+    """
+    ALPHA_STEPS = 16  # Anzahl vorgerenderter Transparenzstufen
+
+    def __init__(self, max_particles=PARTICLE_MAX):
+        self.max_particles = max_particles
+        self._colors = []   # Palette: Index -> (r, g, b, a)
+        self._palette = {}  # (r, g, b, a) -> Index
+        self._sprites = {}  # (color index, size, alpha step) -> Surface
+        self.clear()
+
+    def __len__(self):
+        return len(self.life)
+
     def add_particle(self, x, y, color, velocity, lifetime=1.0, size=5):
         """Add a new particle to the system"""
-        if len(self.particles) < self.max_particles:
-            self.particles.append({
-                'pos': [x, y],
-                'vel': velocity,
-                'lifetime': lifetime,
-                'max_lifetime': lifetime,
-                'color': color,
-                'size': size
-            })
-    
+        if len(self.life) >= self.max_particles:
+            return
+        color = tuple(color) if len(color) == 4 else tuple(color) + (255,)
+        color_index = self._palette.get(color)
+        if color_index is None:
+            color_index = self._palette[color] = len(self._colors)
+            self._colors.append(color)
+        self.x.append(x)
+        self.y.append(y)
+        self.vx.append(velocity[0])
+        self.vy.append(velocity[1])
+        self.life.append(lifetime)
+        self.max_life.append(lifetime)
+        self.size.append(size)
+        self.color.append(color_index)
+
     def update(self, dt):
-        """Update all particles"""
-        for particle in self.particles[:]:  # Create a copy to safely remove while iterating
-            particle['lifetime'] -= dt
-            if particle['lifetime'] <= 0:
-                self.particles.remove(particle)
+        """Move all particles and drop expired ones, in place in a single pass"""
+        x, y, vx, vy, life = self.x, self.y, self.vx, self.vy, self.life
+        i = 0
+        while i < len(life):
+            remaining = life[i] - dt
+            if remaining <= 0:
+                # Das letzte Partikel rückt nach und wird an derselben Stelle weiterbehandelt
+                self._swap_remove(i)
                 continue
-            
-            # Update position
-            particle['pos'][0] += particle['vel'][0] * dt
-            particle['pos'][1] += particle['vel'][1] * dt
-            
-            # Optional: Update size or color based on lifetime
-            fade = particle['lifetime'] / particle['max_lifetime']
-            particle['color'] = (
-                particle['color'][0],
-                particle['color'][1],
-                particle['color'][2],
-                int(255 * fade)
-            )
-    
+            life[i] = remaining
+            x[i] += vx[i] * dt
+            y[i] += vy[i] * dt
+            i += 1
+
+    def _swap_remove(self, i):
+        for column in self._columns():
+            column[i] = column[-1]
+            column.pop()
+
+    def _columns(self):
+        return (self.x, self.y, self.vx, self.vy, self.life, self.max_life, self.size, self.color)
+
+    def sprite(self, color_index, size, step):
+        """Pre-rendered particle sprite for one alpha step"""
+        key = (color_index, size, step)
+        surface = self._sprites.get(key)
+        if surface is None:
+            r, g, b, a = self._colors[color_index]
+            surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, (r, g, b, a * step // self.ALPHA_STEPS), (size, size), size)
+            self._sprites[key] = surface
+        return surface
+
     def draw(self, screen):
         """Draw all particles"""
-        for particle in self.particles:
-            pos = (int(particle['pos'][0]), int(particle['pos'][1]))
-            color = particle['color']
-            size = particle['size']
-            
-            # Create a surface for the particle with alpha
-            particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, color, (size, size), size)
-            screen.blit(particle_surface, (pos[0] - size, pos[1] - size))
-    
+        if not self.life:
+            return
+        steps = self.ALPHA_STEPS
+        sprites = self._sprites
+        batch = []
+        for x, y, life, max_life, size, color in zip(self.x, self.y, self.life, self.max_life,
+                                                   self.size, self.color):
+            # Transparenz folgt der Restlebenszeit, gerundet auf die nächste Stufe
+            step = min(steps, int(life / max_life * steps + 0.5))
+            surface = sprites.get((color, size, step))
+            if surface is None:
+                surface = self.sprite(color, size, step)
+            batch.append((surface, (int(x) - size, int(y) - size)))
+        screen.blits(batch, doreturn=False)
+
+    def bounds(self):
+        """Rect covering all particles, None if there are none"""
+        if not self.life:
+            return None
+        size = max(self.size)
+        left = int(min(self.x)) - size
+        top = int(min(self.y)) - size
+        return pygame.Rect(left, top, int(max(self.x)) + size - left, int(max(self.y)) + size - top)
+
     def clear(self):
         """Clear all particles from the system"""
-        self.particles.clear()
+        self.x = array('d')
+        self.y = array('d')
+        self.vx = array('d')
+        self.vy = array('d')
+        self.life = array('d')
+        self.max_life = array('d')
+        self.size = array('i')
+        self.color = array('i')
 
 class PokemonTextBox:
     """Base class for Pokemon-style text boxes"""
@@ -242,10 +311,15 @@ class InfoBox:
         self.text_lines = []
         self.font = font
         self.font_manager = FontManager()
+        self._rendered = None  # (font, title surface, line surfaces)
+        self.text_version = 0
+        self._drawn_state = None
     
     def set_text(self, text_lines):
         """Set text content with color information"""
         self.text_lines = text_lines
+        self._rendered = None
+        self.text_version += 1
         # Calculate max scroll based on text length
         num_lines = len(text_lines)
         visible_lines = self.height // self.line_height
@@ -278,6 +352,14 @@ class InfoBox:
         """Update method for compatibility with slot machine"""
         pass
     
+    def dirty_rects(self):
+        """Rects that changed since the last call (for DirtyRectRenderer)"""
+        state = (self.visible, self.scroll_offset, self.text_version)
+        if state == self._drawn_state:
+            return []
+        self._drawn_state = state
+        return [pygame.Rect(self.x, self.y, self.width, self.height)]
+    
     def draw(self, screen, font_manager=None):
         if not self.visible:
             return
@@ -291,16 +373,23 @@ class InfoBox:
         pygame.draw.rect(screen, (240, 240, 240), box_rect)
         pygame.draw.rect(screen, (0, 0, 0), box_rect, 2)
         
+        # Render title and lines once, not every frame
+        if self._rendered is None or self._rendered[0] is not text_font:
+            self._rendered = (
+                text_font,
+                self.font.render(self.title, True, (0, 0, 0)),
+                [text_font.render(text, True, color) for text, color in self.text_lines]
+            )
+        _, title, line_surfaces = self._rendered
+        
         # Draw title
-        title = self.font.render(self.title, True, (0, 0, 0))
         title_rect = title.get_rect(centerx=self.x + self.width//2, top=self.y + 10)
         screen.blit(title, title_rect)
         
         # Draw text content
         content_y = self.y + 50 - self.scroll_offset
-        for text, color in self.text_lines:
+        for text_surface in line_surfaces:
             if content_y + self.line_height > self.y and content_y < self.y + self.height:
-                text_surface = text_font.render(text, True, color)
                 screen.blit(text_surface, (self.x + 20, content_y))
             content_y += self.line_height
 
@@ -330,11 +419,11 @@ class InputField:
         pygame.draw.rect(screen, color, self.rect)
         pygame.draw.rect(screen, (0, 0, 0), self.rect, 1)
         
-        label_surface = self.font.render(self.label, True, (0, 0, 0))
+        label_surface = FontManager.render(self.font, self.label, (0, 0, 0))
         screen.blit(label_surface, (self.rect.x, self.rect.y - 20))
         
         if self.text:
-            text_surface = self.font.render(self.text, True, (0, 0, 0))
+            text_surface = FontManager.render(self.font, self.text, (0, 0, 0))
             text_rect = text_surface.get_rect(midleft=(self.rect.x + 5, self.rect.centery))
             screen.blit(text_surface, text_rect)
 
@@ -362,6 +451,15 @@ class PrizeConfig:
             'easy2': {'text': EASY_PRIZES[1] if len(EASY_PRIZES) > 1 else '', 'label': 'Kein Match Preis 2:'}
         }
         
+        # Gewichtungen der Symbole mit Live-Vorschau der Chancen
+        for i, symbol in enumerate(SYMBOLS):
+            self.fields[f'weight{i}'] = {'text': str(WEIGHTS[i]), 'label': f'{symbol} Gewichtung:'}
+        self.odds = OddsPreview(WEIGHTS)
+        self.last_weights = list(WEIGHTS)  # Zuletzt gültige Gewichtung aus den Feldern
+        self.odds_height = 35
+        self._odds_surface = None  # (text, surface)
+        self._drawn_state = None
+        
         # Calculate field positions and max scroll
         y_offset = 80  # Start weiter unten für Labels
         for field in self.fields.values():
@@ -369,7 +467,7 @@ class PrizeConfig:
             y_offset += 65  # Mehr Platz zwischen den Feldern für Labels
         
         # Calculate max scroll
-        self.max_scroll = max(0, y_offset - height + 60)
+        self.max_scroll = max(0, y_offset - height + 60 + self.odds_height)
         
         # Save button
         self.save_button = Button(
@@ -427,10 +525,48 @@ class PrizeConfig:
                 self.visible = False
             else:
                 self.fields[self.active_field]['text'] += event.unicode
+            if self.active_field and self.active_field.startswith('weight'):
+                self.update_odds(self.active_field)
             return True
             
         return False
         
+    @staticmethod
+    def parse_weight(text):
+        """Weight field text as int, None if invalid"""
+        try:
+            weight = int(text.strip())
+        except ValueError:
+            return None
+        return weight if weight >= 0 else None
+        
+    def update_odds(self, name):
+        """Push one edited weight into the odds preview (O(1))"""
+        weight = self.parse_weight(self.fields[name]['text'])
+        self.odds.set_weight(int(name[len('weight'):]), -1 if weight is None else weight)
+        
+    def get_weights(self):
+        """Weights from the input fields, None if any field is invalid
+
+        Valid weights are also kept in last_weights; they are the ones the
+        slot machine applies.
+        """
+        weights = [self.parse_weight(self.fields[f'weight{i}']['text']) for i in range(len(SYMBOLS))]
+        if None in weights or sum(weights) <= 0:
+            return None
+        self.last_weights = weights
+        return weights
+        
+    def odds_text(self):
+        """One-line summary of the previewed odds"""
+        if not self.odds.valid:
+            return "Ungültige Gewichtung"
+        odds = self.odds.class_probabilities()
+        jackpot = odds[JACKPOT]
+        jackpot_text = f"1/{1 / jackpot:,.0f}".replace(',', '.') if jackpot else "nie"
+        triple = odds[JACKPOT] + odds[MAIN]
+        return f"Jackpot {jackpot_text} | 3x {triple:.1%} | 2x {odds[DOUBLE]:.1%}"
+        
     def save_prizes(self):
         """Save the configured prizes to prizes.py"""
         try:
@@ -469,6 +605,11 @@ class PrizeConfig:
                         f.write(f'    "{text}",\n')
                 f.write("]\n")
                 
+                # Save symbol weights; bei ungültigen Feldern die zuletzt gültigen, die auch aktiv sind
+                weights = self.get_weights() or self.last_weights
+                f.write(f"\n# Gewichtungen der Symbole ({', '.join(SYMBOLS)})\n")
+                f.write(f"WEIGHTS = {list(weights)}\n")
+                
         except Exception as e:
             print(f"Error saving prizes: {str(e)}")
             
@@ -498,6 +639,7 @@ class PrizeConfig:
         prizes['main'] = [p for p in prizes['main'] if p]
         prizes['double'] = [p for p in prizes['double'] if p]
         prizes['easy'] = [p for p in prizes['easy'] if p]
+        prizes['weights'] = self.get_weights()
         
         return prizes
         
@@ -510,7 +652,7 @@ class PrizeConfig:
         pygame.draw.rect(screen, (0, 0, 0), self.rect, 2)  # Border
         
         # Draw title
-        title = self.font.render("Preise Konfigurieren", True, (0, 0, 0))
+        title = FontManager.render(self.font, "Preise Konfigurieren", (0, 0, 0))
         title_rect = title.get_rect(centerx=self.rect.centerx, top=self.rect.top + 20)
         screen.blit(title, title_rect)
         
@@ -522,7 +664,7 @@ class PrizeConfig:
             
             if field_rect.bottom > self.rect.top and field_rect.top < self.rect.bottom:
                 # Draw label
-                label = self.font.render(field['label'], True, (0, 0, 0))
+                label = FontManager.render(self.font, field['label'], (0, 0, 0))
                 screen.blit(label, (field_rect.x + 5, field_rect.y - 35))  # Label weiter oben
                 
                 # Draw input box
@@ -532,16 +674,37 @@ class PrizeConfig:
                 
                 # Draw text
                 if field['text']:
-                    text = self.font.render(field['text'], True, (0, 0, 0))
+                    text = FontManager.render(self.font, field['text'], (0, 0, 0))
                     text_rect = text.get_rect(midleft=(field_rect.x + 5, field_rect.centery))
                     screen.blit(text, text_rect)
         
+        # Draw odds preview above the save button
+        odds_rect = pygame.Rect(self.rect.x + 2, self.save_button.rect.top - self.odds_height - 5,
+                                self.rect.width - 4, self.odds_height)
+        pygame.draw.rect(screen, (240, 240, 240), odds_rect)
+        text = self.odds_text()
+        if self._odds_surface is None or self._odds_surface[0] != text:
+            color = (0, 0, 0) if self.odds.valid else (200, 0, 0)
+            self._odds_surface = (text, self.font.render(text, True, color))
+        odds_surface = self._odds_surface[1]
+        screen.blit(odds_surface, odds_surface.get_rect(center=odds_rect.center))
+        
         # Draw save button
         self.save_button.draw(screen)
         
     def update(self):
         """Update method for compatibility with slot machine"""
         pass
+        
+    def dirty_rects(self):
+        """Rects that changed since the last call (for DirtyRectRenderer)"""
+        state = (self.visible, self.scroll_y, self.active_field,
+                 tuple(field['text'] for field in self.fields.values()),
+                 self.save_button.is_hovered)
+        if state == self._drawn_state:
+            return []
+        self._drawn_state = state
+        return [self.rect]
 
 class Slot:
     def __init__(self, x, y, size):
@@ -560,6 +723,8 @@ class WonPrizesList:
         self.max_scroll = 0
         self.line_height = 25
         self.won_prizes = []
+        self.seed = None  # RNG Seed der Session, zum Nachspielen
+        self._drawn_state = None
         
     def add_prize(self, prize_text):
         """Füge einen neuen gewonnenen Preis zur Liste hinzu"""
@@ -584,6 +749,8 @@ class WonPrizesList:
         try:
             with open('games/won_prizes.py', 'w', encoding='utf-8') as f:
                 f.write("# Liste der bereits gewonnenen Preise\n")
+                if self.seed is not None:
+                    f.write(f"# RNG Seed: {self.seed}\n")
                 f.write("WON_PRIZES = [\n")
                 for prize in self.won_prizes:
                     f.write(f'    {{"prize": "{prize["prize"]}", "won_at": "{prize["won_at"]}", "crossed": {prize["crossed"]}}},\n')
@@ -598,6 +765,8 @@ class WonPrizesList:
         try:
             with open('games/won_prizes.py', 'w', encoding='utf-8') as f:
                 f.write("# Liste der bereits gewonnenen Preise\n")
+                if self.seed is not None:
+                    f.write(f"# RNG Seed: {self.seed}\n")
                 f.write("WON_PRIZES = []\n")
         except Exception as e:
             print(f"Error resetting won prizes file: {str(e)}")
@@ -629,8 +798,23 @@ class WonPrizesList:
         
         return False
         
+    def dirty_rects(self):
+        """Rects that changed since the last call (for DirtyRectRenderer)"""
+        spin_count = self.slot_machine.spin_count if hasattr(self, 'slot_machine') else None
+        state = (self.visible, self.scroll_y, self.rect.topleft, spin_count,
+                 tuple((prize["prize"], prize["crossed"]) for prize in self.won_prizes))
+        if state == self._drawn_state:
+            return []
+        self._drawn_state = state
+        return [self.rect]
+        
     def draw(self, screen):
         """Draw the won prizes list"""
+        self.draw_background(screen)
+        self.draw_content(screen)
+        
+    def draw_background(self, screen):
+        """Draw panel and title (static, can be cached)"""
         if not self.visible:
             return
             
@@ -639,10 +823,15 @@ class WonPrizesList:
         pygame.draw.rect(screen, (0, 0, 0), self.rect, 2)
         
         # Draw title
-        title = self.font.render("Gewonnene Preise", True, (0, 0, 0))
+        title = FontManager.render(self.font, "Gewonnene Preise", (0, 0, 0))
         title_rect = title.get_rect(centerx=self.rect.centerx, top=self.rect.top + 10)
         screen.blit(title, title_rect)
         
+    def draw_content(self, screen):
+        """Draw prize rows and spin counter on top of draw_background()"""
+        if not self.visible:
+            return
+            
         # Calculate visible area
         visible_rect = pygame.Rect(
             self.rect.x,
@@ -656,11 +845,11 @@ class WonPrizesList:
         for prize in self.won_prizes:
             if y + self.line_height > visible_rect.y and y < visible_rect.bottom:
                 # Draw time
-                time_text = self.font.render(prize["won_at"], True, (100, 100, 100))
+                time_text = FontManager.render(self.font, prize["won_at"], (100, 100, 100))
                 screen.blit(time_text, (visible_rect.x + 5, y))
                 
                 # Draw prize text with more space for the text
-                prize_text = self.font.render(prize["prize"], True, (0, 0, 0))
+                prize_text = FontManager.render(self.font, prize["prize"], (0, 0, 0))
                 text_x = visible_rect.x + 120  # Mehr Platz für die Zeit
                 
                 if prize["crossed"]:
@@ -680,6 +869,6 @@ class WonPrizesList:
         
         # Draw spin counter at bottom
         if hasattr(self, 'slot_machine'):
-            spins_text = self.font.render(f"Spins: {self.slot_machine.spin_count}", True, (0, 0, 0))
+            spins_text = FontManager.render(self.font, f"Spins: {self.slot_machine.spin_count}", (0, 0, 0))
             spins_rect = spins_text.get_rect(centerx=self.rect.centerx, bottom=self.rect.bottom - 10)
             screen.blit(spins_text, spins_rect)